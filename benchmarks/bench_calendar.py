@@ -0,0 +1,111 @@
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grassailytimer.academic_calendar import AcademicCalendar, batch_progress, calculate_progress, days_until_graduation
+
+
+def reference_days_until_graduation(start_year, num_courses, today):
+    graduation_date = datetime.date(start_year + num_courses, 6, 30)
+    return (graduation_date - today).days if today < graduation_date else 0
+
+
+def reference_calculate_progress(start_year, num_courses, today):
+    total_academic_days = 0
+    studied_days = 0
+    for year in range(start_year, start_year + num_courses):
+        semester1_start = datetime.date(year, 9, 1)
+        semester1_end = datetime.date(year, 12, 31)
+        total_academic_days += (semester1_end - semester1_start).days + 1
+        if today >= semester1_start:
+            studied_days += (min(today, semester1_end) - semester1_start).days + 1
+
+        semester2_start = datetime.date(year + 1, 1, 1)
+        semester2_end = datetime.date(year + 1, 6, 30)
+        total_academic_days += (semester2_end - semester2_start).days + 1
+        if today >= semester2_start:
+            studied_days += (min(today, semester2_end) - semester2_start).days + 1
+
+    total_progress = (studied_days / total_academic_days) * 100
+
+    if today.month >= 9:
+        current_semester_start = datetime.date(today.year, 9, 1)
+        current_semester_end = datetime.date(today.year, 12, 31)
+    else:
+        current_semester_start = datetime.date(today.year, 1, 1)
+        current_semester_end = datetime.date(today.year, 6, 30)
+    semester_days = (current_semester_end - current_semester_start).days + 1
+    semester_progress = (min((today - current_semester_start).days + 1, semester_days) / semester_days) * 100
+
+    return total_progress, semester_progress
+
+
+def make_rows(rows, seed):
+    rng = np.random.default_rng(seed)
+    start_years = rng.integers(2000, 2101, rows)
+    num_courses = rng.integers(1, 7, rows)
+    first_day = np.datetime64("1999-01-01")
+    as_of = first_day + rng.integers(0, 365 * 110, rows).astype("timedelta64[D]")
+    return start_years, num_courses, as_of
+
+
+def run_scalar(function, start_years, num_courses, dates):
+    started = time.perf_counter()
+    results = [function(s, n, d) for s, n, d in zip(start_years, num_courses, dates)]
+    return time.perf_counter() - started, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сравнение циклического и векторного расчета прогресса")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=2023)
+    parser.add_argument("--calendar", help="JSON с описанием календаря (ключ calendar из settings.json)")
+    args = parser.parse_args(argv)
+
+    start_years, num_courses, as_of = make_rows(args.rows, args.seed)
+    start_list = start_years.tolist()
+    courses_list = num_courses.tolist()
+    dates = as_of.astype(datetime.date).tolist()
+
+    calendar = None
+    if args.calendar:
+        with open(args.calendar, "r", encoding="utf-8") as file:
+            definition = json.load(file)
+        calendar = AcademicCalendar.from_settings(definition.get("calendar", definition))
+
+    def reference(s, n, d):
+        return (reference_days_until_graduation(s, n, d),) + reference_calculate_progress(s, n, d)
+
+    def indexed(s, n, d):
+        return (days_until_graduation(s, n, d, calendar),) + calculate_progress(s, n, d, calendar)
+
+    started = time.perf_counter()
+    days_left, total_progress, semester_progress = batch_progress(start_years, num_courses, as_of, calendar)
+    batch_time = time.perf_counter() - started
+    vectorized = list(zip(days_left.tolist(), total_progress.tolist(), semester_progress.tolist()))
+
+    indexed_time, scalar = run_scalar(indexed, start_list, courses_list, dates)
+    if vectorized != scalar:
+        raise SystemExit("Векторный расчет расходится с поштучным")
+
+    print(f"rows: {args.rows}")
+    if calendar is None:
+        reference_time, expected = run_scalar(reference, start_list, courses_list, dates)
+        if scalar != expected:
+            raise SystemExit("Интервальный индекс расходится с эталонной реализацией")
+        print(f"reference loop:    {reference_time:8.3f} s")
+        print(f"closed form:       {indexed_time:8.3f} s  (x{reference_time / indexed_time:.1f})")
+        print(f"batch_progress:    {batch_time:8.3f} s  (x{reference_time / batch_time:.1f})")
+    else:
+        print(f"interval index:    {indexed_time:8.3f} s")
+        print(f"batch_progress:    {batch_time:8.3f} s  (x{indexed_time / batch_time:.1f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def current_rss_kb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss // 1024
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/status", "r") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def child(mode):
+    started = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    from grassailytimer.gui import TransparentWidget
+
+    rss_before = current_rss_kb()
+    constructed = time.perf_counter()
+    widget = TransparentWidget()
+    if mode == "eager":
+        widget.ensure_settings_panel()
+        widget.ensure_notification_label()
+    widget.show()
+    app.processEvents()
+    shown = time.perf_counter()
+
+    print(json.dumps({
+        "widget_ms": (shown - constructed) * 1000,
+        "startup_ms": (shown - started) * 1000,
+        "widget_rss_kb": current_rss_kb() - rss_before,
+        "rss_kb": current_rss_kb(),
+    }))
+
+
+def measure(mode, runs):
+    samples = []
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, LOCALAPPDATA=home, QT_QPA_PLATFORM="offscreen")
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, __file__, "--child", mode], env=env, check=True,
+                                    capture_output=True, text=True).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Время запуска и RSS виджета под offscreen-платформой Qt")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", choices=("lazy", "eager"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child(args.child)
+        return
+
+    results = {mode: measure(mode, args.runs) for mode in ("lazy", "eager")}
+    print(f"{'':8}{'widget, ms':>12}{'startup, ms':>13}{'widget RSS, KiB':>17}{'RSS, KiB':>10}")
+    for mode, result in results.items():
+        print(f"{mode:8}{result['widget_ms']:12.1f}{result['startup_ms']:13.1f}"
+              f"{result['widget_rss_kb']:17.0f}{result['rss_kb']:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORBIDDEN_PREFIXES = ("PyQt6", "numpy")
+BUDGETS_MS = {
+    "grassailytimer": 15.0,
+    "grassailytimer.core": 15.0,
+    "grassailytimer.batch": 40.0,
+}
+
+
+def import_time(module):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    imported = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported.append((name[1:], int(cumulative)))
+
+    names = {name.strip() for name, _ in imported}
+    package_root = module.split(".")[0]
+    total_us = sum(cumulative for name, cumulative in imported
+                   if not name.startswith(" ") and name.split(".")[0] == package_root)
+    return total_us / 1000, names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Проверка времени импорта модулей без GUI (python -X importtime)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Множитель бюджета для медленных машин")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for module, budget_ms in BUDGETS_MS.items():
+        elapsed_ms, names = import_time(module)
+        heavy = sorted(name for name in names if name.startswith(FORBIDDEN_PREFIXES))
+        status = "ok"
+        if heavy:
+            status = "FAIL"
+            failures.append(f"{module} импортирует {', '.join(heavy)}")
+        if elapsed_ms > budget_ms * args.scale:
+            status = "FAIL"
+            failures.append(f"{module}: {elapsed_ms:.1f} ms > {budget_ms * args.scale:.1f} ms")
+        print(f"{module:24}{elapsed_ms:8.1f} ms  (budget {budget_ms * args.scale:.1f} ms)  {status}")
+
+    if failures:
+        print("\n".join(failures), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
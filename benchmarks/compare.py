@@ -0,0 +1,61 @@
+import argparse
+import json
+import sys
+
+
+def flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def load(path):
+    with open(path, "r", encoding="utf-8") as file:
+        report = json.load(file)
+    return report, flatten(report["cases"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сравнение двух JSON-отчетов benchmarks/suite.py")
+    parser.add_argument("base", help="Отчет до изменений")
+    parser.add_argument("new", help="Отчет после изменений")
+    parser.add_argument("--metric", default="median_ms", help="Какие метрики сравнивать (по умолчанию median_ms)")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Допустимое замедление, доля (по умолчанию 0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    base_report, base = load(args.base)
+    new_report, new = load(args.new)
+    print(f"{base_report.get('revision')} -> {new_report.get('revision')}")
+
+    failures = []
+    for name in sorted(set(base) | set(new)):
+        if name.endswith(".checksum"):
+            if name in base and name in new and base[name] != new[name]:
+                failures.append(f"{name}: результат изменился ({base[name]} -> {new[name]})")
+            continue
+        if not name.endswith("." + args.metric):
+            continue
+        if name not in base or name not in new:
+            print(f"{name:48}{'только в ' + ('новом' if name in new else 'старом'):>28}")
+            continue
+
+        ratio = new[name] / base[name] if base[name] else float("inf")
+        status = ""
+        if ratio > 1 + args.threshold:
+            status = "  REGRESSION"
+            failures.append(f"{name}: {base[name]:.2f} -> {new[name]:.2f} ms (x{ratio:.2f})")
+        print(f"{name:48}{base[name]:10.2f}{new[name]:10.2f}   x{ratio:5.2f}{status}")
+
+    if failures:
+        print("\n".join(failures), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
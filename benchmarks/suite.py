@@ -0,0 +1,296 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+START_YEARS = range(2000, 2101)
+COURSES = range(1, 7)
+DATES_PER_PROGRAM = 8
+BENCH_SETTINGS = {"start_year": 2023, "num_courses": 4, "opacity": 50}
+
+
+def summarize(samples_ms):
+    samples_ms = sorted(samples_ms)
+    return {
+        "runs": len(samples_ms),
+        "median_ms": statistics.median(samples_ms),
+        "p95_ms": samples_ms[min(len(samples_ms) - 1, int(len(samples_ms) * 0.95))],
+        "min_ms": samples_ms[0],
+        "max_ms": samples_ms[-1],
+    }
+
+
+def calendar_inputs():
+    inputs = []
+    for start_year in START_YEARS:
+        for num_courses in COURSES:
+            first = datetime.date(start_year - 1, 1, 1)
+            span = (datetime.date(start_year + num_courses + 1, 1, 1) - first).days
+            dates = [first + datetime.timedelta(days=span * step // (DATES_PER_PROGRAM - 1))
+                     for step in range(DATES_PER_PROGRAM)]
+            inputs.append((start_year, num_courses, dates))
+    return inputs
+
+
+def time_calls(call, repeat):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, result
+
+
+def case_calendar_academic_days(repeat):
+    from grassailytimer.core import calculate_academic_days
+    pairs = [(start_year, num_courses) for start_year, num_courses, _ in calendar_inputs()]
+
+    def call():
+        return sum(calculate_academic_days(start_year, num_courses) for start_year, num_courses in pairs)
+
+    samples, checksum = time_calls(call, repeat)
+    return dict(summarize(samples), calls=len(pairs), checksum=checksum)
+
+
+def case_calendar_progress(repeat):
+    from grassailytimer.core import calculate_progress
+    inputs = calendar_inputs()
+
+    def call():
+        total = 0.0
+        for start_year, num_courses, dates in inputs:
+            for today in dates:
+                total_progress, semester_progress = calculate_progress(start_year, num_courses, today)
+                total += total_progress + semester_progress
+        return round(total, 6)
+
+    samples, checksum = time_calls(call, repeat)
+    return dict(summarize(samples), calls=len(inputs) * DATES_PER_PROGRAM, checksum=checksum)
+
+
+def case_calendar_days_until_graduation(repeat):
+    from grassailytimer.core import days_until_graduation
+    inputs = calendar_inputs()
+
+    def call():
+        return sum(days_until_graduation(start_year, num_courses, today)
+                   for start_year, num_courses, dates in inputs for today in dates)
+
+    samples, checksum = time_calls(call, repeat)
+    return dict(summarize(samples), calls=len(inputs) * DATES_PER_PROGRAM, checksum=checksum)
+
+
+def make_widget():
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    from grassailytimer.gui import TransparentWidget
+    widget = TransparentWidget()
+    widget.show()
+    app.processEvents()
+    return app, widget
+
+
+class PaintRecorder:
+    def __init__(self, widget):
+        from PyQt6.QtCore import QEvent, QObject
+
+        recorder = self
+
+        class Filter(QObject):
+            def eventFilter(self, watched, event):
+                if event.type() == QEvent.Type.Paint:
+                    recorder.stamps.append(time.perf_counter())
+                return False
+
+        self.stamps = []
+        self.filter = Filter()
+        widget.installEventFilter(self.filter)
+
+    def frame_times(self):
+        return [(later - earlier) * 1000 for earlier, later in zip(self.stamps, self.stamps[1:])]
+
+
+def wait_for(app, condition, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def case_cold_start(repeat):
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, __file__, "--first-paint", repr(time.time())], env=os.environ,
+                                check=True, capture_output=True, text=True).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return summarize(samples)
+
+
+def first_paint(launched):
+    from PyQt6.QtCore import QEvent, QObject
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    from grassailytimer.gui import TransparentWidget
+
+    class Filter(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Type.Paint:
+                print((time.time() - launched) * 1000, flush=True)
+                app.exit(0)
+            return False
+
+    widget = TransparentWidget()
+    paint_filter = Filter()
+    widget.installEventFilter(paint_filter)
+    widget.show()
+    app.exec()
+
+
+def case_toggle_settings(repeat):
+    app, widget = make_widget()
+    recorder = PaintRecorder(widget)
+    call_samples = []
+    frames = []
+    for _ in range(repeat * 2):
+        recorder.stamps.clear()
+        started = time.perf_counter()
+        widget.toggle_settings()
+        call_samples.append((time.perf_counter() - started) * 1000)
+        animation = widget.animation
+        wait_for(app, lambda: animation.state() == animation.State.Stopped)
+        app.processEvents()
+        frames.extend(recorder.frame_times())
+    return dict(summarize(frames or [0.0]), frames=len(frames), call=summarize(call_samples))
+
+
+def case_opacity_sweep(repeat):
+    app, widget = make_widget()
+    values = list(range(25, 61)) + list(range(60, 24, -1))
+    samples = []
+    for _ in range(repeat):
+        for value in values:
+            started = time.perf_counter()
+            widget.change_opacity(value)
+            widget.repaint()
+            samples.append((time.perf_counter() - started) * 1000)
+    return dict(summarize(samples), steps=len(values))
+
+
+def case_background_import(repeat):
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QColor, QImage, QLinearGradient, QPainter
+    from grassailytimer.image_import import BackgroundImportTask
+
+    make_widget()
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        source = QImage(4000, 3000, QImage.Format.Format_RGB32)
+        painter = QPainter(source)
+        gradient = QLinearGradient(0, 0, 4000, 3000)
+        gradient.setColorAt(0, QColor("#2d6a4f"))
+        gradient.setColorAt(1, QColor("#f4a261"))
+        painter.fillRect(source.rect(), gradient)
+        painter.setPen(Qt.GlobalColor.white)
+        for offset in range(0, 4000, 40):
+            painter.drawLine(offset, 0, 4000 - offset, 3000)
+        painter.end()
+
+        for source_format in ("jpg", "png"):
+            source_path = os.path.join(directory, f"source.{source_format}")
+            source.save(source_path)
+            for image_format in ("png", "webp", "jpg"):
+                def call():
+                    return BackgroundImportTask(source_path, directory, image_format=image_format).import_image()
+
+                samples, target = time_calls(call, repeat)
+                results[f"{source_format}_to_{image_format}"] = dict(summarize(samples),
+                                                                     bytes=os.path.getsize(target))
+    return results
+
+
+CASES = {
+    "calendar_academic_days": (case_calendar_academic_days, 20),
+    "calendar_progress": (case_calendar_progress, 5),
+    "calendar_days_until_graduation": (case_calendar_days_until_graduation, 5),
+    "cold_start_first_paint": (case_cold_start, 5),
+    "toggle_settings": (case_toggle_settings, 5),
+    "opacity_sweep": (case_opacity_sweep, 5),
+    "background_import": (case_background_import, 3),
+}
+
+
+def run_case(name, repeat, home):
+    env = dict(os.environ, HOME=home, LOCALAPPDATA=home, QT_QPA_PLATFORM="offscreen")
+    settings_dir = os.path.join(home, "GrassallyTimer" if sys.platform == "win32" else ".grassallytimer")
+    os.makedirs(settings_dir, exist_ok=True)
+    with open(os.path.join(settings_dir, "settings.json"), "w") as file:
+        json.dump(BENCH_SETTINGS, file)
+    output = subprocess.run([sys.executable, __file__, "--child", name, "--repeat", str(repeat)], env=env,
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Набор замеров: календарь, запуск и отрисовка под offscreen-платформой")
+    parser.add_argument("cases", nargs="*", metavar="case",
+                        help=f"Замеры для запуска (по умолчанию все): {', '.join(CASES)}")
+    parser.add_argument("-o", "--output", help="Куда записать JSON с результатами")
+    parser.add_argument("--repeat", type=int, help="Число повторов вместо значения по умолчанию")
+    parser.add_argument("--child", choices=list(CASES), help=argparse.SUPPRESS)
+    parser.add_argument("--first-paint", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"неизвестные замеры: {', '.join(unknown)}")
+
+    if args.first_paint is not None:
+        first_paint(args.first_paint)
+        return
+    if args.child:
+        function, repeat = CASES[args.child]
+        print(json.dumps(function(args.repeat or repeat)))
+        return
+
+    report = {
+        "revision": git_revision(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": {},
+    }
+    for name in args.cases or CASES:
+        with tempfile.TemporaryDirectory() as home:
+            result = run_case(name, args.repeat or CASES[name][1], home)
+        report["cases"][name] = result
+        median = result.get("median_ms")
+        print(f"{name:32}" + (f"{median:10.2f} ms" if median is not None else "      done"), file=sys.stderr)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
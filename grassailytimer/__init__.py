@@ -0,0 +1,10 @@
+from .core import (AcademicCalendar, DEFAULT_CALENDAR, batch_progress, calculate_academic_days, calculate_progress,
+                   calculate_studied_days, current_term, days_until_graduation, get_images_dir, get_settings_path,
+                   load_settings, next_change_date, save_settings)
+
+
+def __getattr__(name):
+    if name == "TransparentWidget":
+        from .gui import TransparentWidget
+        return TransparentWidget
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,39 @@
+import os
+import sys
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if "--trace" in argv:
+        index = argv.index("--trace")
+        from .trace import DEFAULT_TRACE_PATH, enable
+        path = argv[index + 1] if index + 1 < len(argv) else None
+        if path is not None and (path.startswith("-") or path == "batch"):
+            path = None
+        enable(path or DEFAULT_TRACE_PATH)
+        del argv[index:index + (2 if path else 1)]
+    from .metrics import port_from
+    from .trace import METRICS_ENV_VAR
+    metrics_port = None
+    if "--metrics" in argv:
+        index = argv.index("--metrics")
+        value = argv[index + 1] if index + 1 < len(argv) and argv[index + 1].isdigit() else None
+        metrics_port = port_from(value)
+        del argv[index:index + (2 if value else 1)]
+    elif os.environ.get(METRICS_ENV_VAR):
+        metrics_port = port_from(os.environ[METRICS_ENV_VAR])
+    if argv[:1] == ["batch"]:
+        from .batch import main as batch_main
+        return batch_main(argv[1:])
+
+    from .single_instance import forward_to_running_instance, split_commands
+    commands, qt_argv = split_commands(argv)
+    if forward_to_running_instance(commands):
+        return 0
+
+    from .gui import run
+    return run(qt_argv, commands, metrics_port)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
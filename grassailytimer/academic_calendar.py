@@ -0,0 +1,403 @@
+import bisect
+import datetime
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+INDEX_YEARS_MARGIN = 10
+FALL_SEMESTER_DAYS = 122  # 1 сентября - 31 декабря
+SPRING_SEMESTER_DAYS = 181  # 1 января - 30 июня в невисокосный год
+SEPTEMBER_1_OFFSET = 243  # номер дня 1 сентября от 1 января (с нуля) в невисокосный год
+
+DEFAULT_CALENDAR_SETTINGS = {
+    "terms": [
+        {"name": "Осенний семестр", "start": "09-01", "end": "12-31"},
+        {"name": "Весенний семестр", "start": "01-01", "end": "06-30"},
+    ],
+    "holidays": [],
+    "breaks": [],
+}
+
+
+def _parse_month_day(value):
+    try:
+        month, day = (int(part) for part in value.split("-"))
+        datetime.date(2000, month, day)
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError(f"Некорректная дата календаря: {value!r}") from None
+    return month, day
+
+
+def _parse_date_or_month_day(value):
+    if isinstance(value, str) and value.count("-") == 2:
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"Некорректная дата календаря: {value!r}") from None
+    return _parse_month_day(value)
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _leaps_through(year):
+    return year // 4 - year // 100 + year // 400
+
+
+def _jan1_ordinal(year):
+    return 365 * (year - 1) + _leaps_through(year - 1) + 1
+
+
+def _spring_days_between(first_year, last_year):
+    if last_year < first_year:
+        return 0
+    return (SPRING_SEMESTER_DAYS * (last_year - first_year + 1)
+            + _leaps_through(last_year) - _leaps_through(first_year - 1))
+
+
+def _ordinal(year, month_day):
+    month, day = month_day
+    try:
+        return datetime.date(year, month, day).toordinal()
+    except ValueError:
+        return None
+
+
+class AcademicCalendar:
+    def __init__(self, terms, holidays=(), breaks=()):
+        if not terms:
+            raise ValueError("Календарь должен содержать хотя бы один семестр")
+
+        self.terms = []
+        year_offset = 0
+        previous_start = None
+        for term in terms:
+            start = _parse_month_day(term["start"])
+            end = _parse_month_day(term["end"])
+            if previous_start is not None and start <= previous_start:
+                year_offset += 1
+            previous_start = start
+            end_offset = year_offset + (1 if end < start else 0)
+            self.terms.append((term.get("name", ""), start, end, year_offset, end_offset))
+
+        self._check_overlaps()
+
+        self.holidays = [_parse_date_or_month_day(value) for value in holidays]
+        self.breaks = [(_parse_date_or_month_day(item["start"]), _parse_date_or_month_day(item["end"]))
+                       for item in breaks]
+        self.first_year = None
+        self.last_year = None
+
+    def _check_overlaps(self):
+        # Трех лет подряд с високосным посередине хватает, чтобы увидеть пересечения через границу года.
+        ranges = []
+        for year in range(2003, 2006):
+            for name, start, end, year_offset, end_offset in self.terms:
+                ranges.append((_ordinal(year + year_offset, start) or _ordinal(year + year_offset, (3, 1)),
+                               _ordinal(year + end_offset, end) or _ordinal(year + end_offset, (2, 28)), name))
+        ranges.sort()
+        for (_, previous_end, previous_name), (start, _, name) in zip(ranges, ranges[1:]):
+            if start <= previous_end:
+                raise ValueError(f"Семестры календаря пересекаются: {previous_name!r} и {name!r}")
+
+    @classmethod
+    def from_settings(cls, settings):
+        if not settings or settings == DEFAULT_CALENDAR_SETTINGS:
+            return DefaultAcademicCalendar()
+        try:
+            return cls(settings["terms"], settings.get("holidays", ()), settings.get("breaks", ()))
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"Некорректное описание календаря: {error}") from None
+
+    def _excluded_ranges(self, first_calendar_year, last_calendar_year):
+        ranges = []
+        for year in range(first_calendar_year, last_calendar_year + 1):
+            for holiday in self.holidays:
+                if isinstance(holiday, datetime.date):
+                    if holiday.year == year:
+                        ranges.append((holiday.toordinal(), holiday.toordinal()))
+                    continue
+                ordinal = _ordinal(year, holiday)
+                if ordinal is not None:
+                    ranges.append((ordinal, ordinal))
+            for start, end in self.breaks:
+                if isinstance(start, datetime.date):
+                    if start.year == year:
+                        end_date = end if isinstance(end, datetime.date) else datetime.date(start.year, *end)
+                        ranges.append((start.toordinal(), end_date.toordinal()))
+                    continue
+                end_year = year + 1 if end < start else year
+                start_ordinal = _ordinal(year, start)
+                end_ordinal = _ordinal(end_year, end)
+                if start_ordinal is not None and end_ordinal is not None:
+                    ranges.append((start_ordinal, end_ordinal))
+
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return merged
+
+    def _build_index(self, first_year, last_year):
+        term_starts = []
+        term_ends = []
+        term_names = []
+        for year in range(first_year, last_year + 1):
+            for name, start, end, year_offset, end_offset in self.terms:
+                start_ordinal = _ordinal(year + year_offset, start)
+                end_ordinal = _ordinal(year + end_offset, end)
+                term_starts.append(start_ordinal)
+                term_ends.append(end_ordinal)
+                term_names.append(name)
+
+        excluded = self._excluded_ranges(first_year - 1, last_year + max(term[4] for term in self.terms) + 1)
+        excluded_starts = [start for start, _ in excluded]
+
+        interval_starts = []
+        interval_ends = []
+        interval_cumulative = []
+        total = 0
+        for term_start, term_end in sorted(zip(term_starts, term_ends)):
+            cursor = term_start
+            position = max(0, bisect.bisect_right(excluded_starts, term_start) - 1)
+            while cursor <= term_end:
+                while position < len(excluded) and excluded[position][1] < cursor:
+                    position += 1
+                if position < len(excluded) and excluded[position][0] <= cursor:
+                    cursor = excluded[position][1] + 1
+                    continue
+                piece_end = term_end
+                if position < len(excluded):
+                    piece_end = min(piece_end, excluded[position][0] - 1)
+                interval_starts.append(cursor)
+                interval_ends.append(piece_end)
+                interval_cumulative.append(total)
+                total += piece_end - cursor + 1
+                cursor = piece_end + 1
+
+        order = sorted(range(len(term_starts)), key=term_starts.__getitem__)
+        self.term_starts = [term_starts[i] for i in order]
+        self.term_ends = [term_ends[i] for i in order]
+        self.term_ends_running_max = []
+        for term_end in self.term_ends:
+            self.term_ends_running_max.append(max(term_end, self.term_ends_running_max[-1])
+                                              if self.term_ends_running_max else term_end)
+        self.term_names = [term_names[i] for i in order]
+        self.interval_starts = interval_starts
+        self.interval_ends = interval_ends
+        self.interval_cumulative = interval_cumulative
+        self.first_year = first_year
+        self.last_year = last_year
+        self.terms_per_year = len(self.terms)
+
+    def ensure_years(self, first_year, last_year):
+        if self.first_year is not None and self.first_year <= first_year and last_year <= self.last_year:
+            return
+        if self.first_year is not None:
+            first_year = min(first_year, self.first_year)
+            last_year = max(last_year, self.last_year)
+        self._build_index(first_year - INDEX_YEARS_MARGIN, last_year + INDEX_YEARS_MARGIN)
+
+    def study_days_through(self, ordinal):
+        position = bisect.bisect_right(self.interval_starts, ordinal) - 1
+        if position < 0:
+            return 0
+        return (self.interval_cumulative[position]
+                + min(ordinal, self.interval_ends[position]) - self.interval_starts[position] + 1)
+
+    def program_bounds(self, start_year, num_courses):
+        self.ensure_years(start_year, start_year + num_courses)
+        first = (start_year - self.first_year) * self.terms_per_year
+        last = first + num_courses * self.terms_per_year - 1
+        return self.term_starts[first], self.term_ends_running_max[last]
+
+    def term_position(self, ordinal):
+        year = datetime.date.fromordinal(ordinal).year
+        self.ensure_years(year - 1, year + 1)
+        return bisect.bisect_right(self.term_starts, ordinal) - 1
+
+    def current_term(self, today=None):
+        today = today or datetime.date.today()
+        position = self.term_position(today.toordinal())
+        return (self.term_names[position],
+                datetime.date.fromordinal(self.term_starts[position]),
+                datetime.date.fromordinal(self.term_ends[position]))
+
+    def academic_days(self, start_year, num_courses):
+        program_start, program_end = self.program_bounds(start_year, num_courses)
+        return self.study_days_through(program_end) - self.study_days_through(program_start - 1)
+
+    def studied_days(self, start_year, num_courses, today):
+        program_start, program_end = self.program_bounds(start_year, num_courses)
+        ordinal = min(today.toordinal(), program_end)
+        if ordinal < program_start:
+            return 0
+        return self.study_days_through(ordinal) - self.study_days_through(program_start - 1)
+
+    def days_until_graduation(self, start_year, num_courses, today):
+        _, program_end = self.program_bounds(start_year, num_courses)
+        return max(0, program_end - today.toordinal())
+
+    def semester_progress(self, today):
+        ordinal = today.toordinal()
+        position = self.term_position(ordinal)
+        term_start = self.term_starts[position]
+        term_end = self.term_ends[position]
+        before = self.study_days_through(term_start - 1)
+        term_days = self.study_days_through(term_end) - before
+        if term_days == 0:
+            return 100.0 if ordinal > term_end else 0.0
+        return ((self.study_days_through(min(ordinal, term_end)) - before) / term_days) * 100
+
+    def progress(self, start_year, num_courses, today):
+        total_academic_days = self.academic_days(start_year, num_courses)
+        studied_days = self.studied_days(start_year, num_courses, today)
+        total_progress = (studied_days / total_academic_days) * 100 if total_academic_days else 100.0
+        return total_progress, self.semester_progress(today)
+
+
+class DefaultAcademicCalendar(AcademicCalendar):
+    """Встроенный календарь без праздников: дни считаются по формулам, без поиска по индексу.
+
+    Индекс строится только для current_term, program_bounds и batch_progress.
+    """
+
+    def __init__(self):
+        super().__init__(DEFAULT_CALENDAR_SETTINGS["terms"])
+
+    def academic_days(self, start_year, num_courses):
+        if num_courses <= 0:
+            return 0
+        return FALL_SEMESTER_DAYS * num_courses + _spring_days_between(start_year + 1, start_year + num_courses)
+
+    def studied_days(self, start_year, num_courses, today):
+        year = today.year
+        last_fall_year = start_year + num_courses - 1
+        last_spring_year = start_year + num_courses
+
+        studied_days = FALL_SEMESTER_DAYS * max(0, min(year - 1, last_fall_year) - start_year + 1)
+        studied_days += _spring_days_between(start_year + 1, min(year - 1, last_spring_year))
+
+        day_of_year = today.toordinal() - _jan1_ordinal(year)
+        leap = _is_leap(year)
+        if start_year <= year <= last_fall_year:
+            studied_days += max(0, day_of_year - SEPTEMBER_1_OFFSET - leap + 1)
+        if start_year < year <= last_spring_year:
+            studied_days += min(day_of_year + 1, SPRING_SEMESTER_DAYS + leap)
+        return studied_days
+
+    def days_until_graduation(self, start_year, num_courses, today):
+        graduation_year = start_year + num_courses
+        graduation_ordinal = _jan1_ordinal(graduation_year) + SPRING_SEMESTER_DAYS - 1 + _is_leap(graduation_year)
+        return max(0, graduation_ordinal - today.toordinal())
+
+    def semester_progress(self, today):
+        day_of_year = today.toordinal() - _jan1_ordinal(today.year)
+        leap = _is_leap(today.year)
+        if today.month >= 9:
+            return ((day_of_year - SEPTEMBER_1_OFFSET - leap + 1) / FALL_SEMESTER_DAYS) * 100
+        semester_days = SPRING_SEMESTER_DAYS + leap
+        return (min(day_of_year + 1, semester_days) / semester_days) * 100
+
+
+DEFAULT_CALENDAR = AcademicCalendar.from_settings(None)
+
+
+def calculate_academic_days(start_year, num_courses, calendar=None):
+    return (calendar or DEFAULT_CALENDAR).academic_days(start_year, num_courses)
+
+
+def calculate_studied_days(start_year, num_courses, today=None, calendar=None):
+    return (calendar or DEFAULT_CALENDAR).studied_days(start_year, num_courses, today or datetime.date.today())
+
+
+def days_until_graduation(start_year, num_courses, today=None, calendar=None):
+    return (calendar or DEFAULT_CALENDAR).days_until_graduation(
+        start_year, num_courses, today or datetime.date.today())
+
+
+def calculate_progress(start_year, num_courses, today=None, calendar=None):
+    return (calendar or DEFAULT_CALENDAR).progress(start_year, num_courses, today or datetime.date.today())
+
+
+def current_term(today=None, calendar=None):
+    return (calendar or DEFAULT_CALENDAR).current_term(today)
+
+
+def batch_progress(start_years, num_courses, as_of=None, calendar=None):
+    """Векторный расчет для массивов студентов.
+
+    Принимает массивы годов начала, количества курсов и дат (``datetime64[D]``
+    или всё, что в него приводится; ``None`` - сегодня) и возвращает массивы
+    ``(days_left, total_progress, semester_progress)``, совпадающие поэлементно
+    с ``days_until_graduation`` и ``calculate_progress``.
+    """
+    import numpy as np
+
+    calendar = calendar or DEFAULT_CALENDAR
+    start_years = np.asarray(start_years, dtype=np.int64)
+    num_courses = np.asarray(num_courses, dtype=np.int64)
+    if as_of is None:
+        as_of = datetime.date.today()
+    as_of = np.asarray(as_of, dtype="datetime64[D]")
+    start_years, num_courses, as_of = np.broadcast_arrays(start_years, num_courses, as_of)
+    if start_years.size == 0:
+        empty = np.zeros(start_years.shape)
+        return empty.astype(np.int64), empty, empty
+
+    ordinal = as_of.astype(np.int64) + EPOCH_ORDINAL
+    years = as_of.astype("datetime64[Y]").astype(np.int64) + 1970
+    calendar.ensure_years(int(min(start_years.min(), years.min() - 1)),
+                          int(max((start_years + num_courses).max(), years.max() + 1)))
+
+    interval_starts = np.asarray(calendar.interval_starts, dtype=np.int64)
+    interval_ends = np.asarray(calendar.interval_ends, dtype=np.int64)
+    interval_cumulative = np.asarray(calendar.interval_cumulative, dtype=np.int64)
+    term_starts = np.asarray(calendar.term_starts, dtype=np.int64)
+    term_ends = np.asarray(calendar.term_ends, dtype=np.int64)
+
+    def study_days_through(ordinals):
+        position = np.searchsorted(interval_starts, ordinals, side="right") - 1
+        clipped = np.maximum(position, 0)
+        days = (interval_cumulative[clipped]
+                + np.minimum(ordinals, interval_ends[clipped]) - interval_starts[clipped] + 1)
+        return np.where(position >= 0, days, 0)
+
+    first_term = (start_years - calendar.first_year) * calendar.terms_per_year
+    last_term = first_term + num_courses * calendar.terms_per_year - 1
+    program_start = term_starts[first_term]
+    program_end = np.asarray(calendar.term_ends_running_max, dtype=np.int64)[last_term]
+
+    before_program = study_days_through(program_start - 1)
+    total_academic_days = study_days_through(program_end) - before_program
+    studied_days = np.where(ordinal < program_start, 0,
+                            study_days_through(np.minimum(ordinal, program_end)) - before_program)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_progress = np.where(total_academic_days > 0, (studied_days / total_academic_days) * 100, 100.0)
+
+    days_left = np.maximum(0, program_end - ordinal)
+
+    term = np.searchsorted(term_starts, ordinal, side="right") - 1
+    before_term = study_days_through(term_starts[term] - 1)
+    term_days = study_days_through(term_ends[term]) - before_term
+    term_studied = study_days_through(np.minimum(ordinal, term_ends[term])) - before_term
+    with np.errstate(divide="ignore", invalid="ignore"):
+        semester_progress = np.where(term_days > 0, (term_studied / term_days) * 100,
+                                     np.where(ordinal > term_ends[term], 100.0, 0.0))
+
+    return days_left, total_progress, semester_progress
+
+
+def next_change_date(start_year, num_courses, today=None, horizon_days=366, calendar=None):
+    today = today or datetime.date.today()
+    calendar = calendar or DEFAULT_CALENDAR
+    current = ((calendar.days_until_graduation(start_year, num_courses, today),)
+               + calendar.progress(start_year, num_courses, today))
+    for offset in range(1, horizon_days + 1):
+        day = today + datetime.timedelta(days=offset)
+        values = ((calendar.days_until_graduation(start_year, num_courses, day),)
+                  + calendar.progress(start_year, num_courses, day))
+        if values != current:
+            return day
+    return None
@@ -0,0 +1,70 @@
+from PyQt6.QtCore import (QAbstractAnimation, QEasingCurve, QObject, QParallelAnimationGroup, QPoint,
+                          QPropertyAnimation, QSize)
+from PyQt6.QtWidgets import QGraphicsOpacityEffect
+
+from .trace import traced
+
+
+class ButtonPressAnimator(QObject):
+    DURATION = 100
+    PRESS_OFFSET = QPoint(0, 2)
+    PRESS_SHRINK = QSize(4, 4)
+    PRESSED_OPACITY = 0.7
+
+    def __init__(self, button):
+        super().__init__(button)
+        self.button = button
+        self.is_pressed = False
+        self.rest_pos = None
+        self.rest_size = None
+
+        self.effect = QGraphicsOpacityEffect(button)
+        self.effect.setEnabled(False)
+        button.setGraphicsEffect(self.effect)
+
+        self.pos_animation = QPropertyAnimation(button, b"pos", self)
+        self.size_animation = QPropertyAnimation(button, b"size", self)
+        self.opacity_animation = QPropertyAnimation(self.effect, b"opacity", self)
+
+        self.group = QParallelAnimationGroup(self)
+        for animation in (self.pos_animation, self.size_animation, self.opacity_animation):
+            animation.setDuration(self.DURATION)
+            animation.setEasingCurve(QEasingCurve.Type.OutQuad)
+            self.group.addAnimation(animation)
+        self.group.finished.connect(self.on_finished)
+
+        button.pressed.connect(self.press)
+        button.released.connect(self.release)
+
+    def press(self):
+        if not self.is_pressed and self.group.state() == QAbstractAnimation.State.Stopped:
+            self.rest_pos = self.button.pos()
+            self.rest_size = self.button.size()
+        self.is_pressed = True
+        self.animate_to(self.rest_pos + self.PRESS_OFFSET, self.rest_size - self.PRESS_SHRINK, self.PRESSED_OPACITY)
+
+    def release(self):
+        if self.rest_pos is None:
+            return
+        self.is_pressed = False
+        self.animate_to(self.rest_pos, self.rest_size, 1.0)
+
+    @traced("button_press_animation", "animation")
+    def animate_to(self, pos, size, opacity):
+        self.group.stop()
+        self.effect.setEnabled(True)
+        self.pos_animation.setStartValue(self.button.pos())
+        self.pos_animation.setEndValue(pos)
+        self.size_animation.setStartValue(self.button.size())
+        self.size_animation.setEndValue(size)
+        self.opacity_animation.setStartValue(self.effect.opacity())
+        self.opacity_animation.setEndValue(opacity)
+        self.group.start()
+
+    def settle(self):
+        if self.group.state() != QAbstractAnimation.State.Stopped:
+            self.group.setCurrentTime(self.group.totalDuration())
+
+    def on_finished(self):
+        if not self.is_pressed:
+            self.effect.setEnabled(False)
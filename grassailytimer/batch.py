@@ -0,0 +1,205 @@
+import argparse
+import collections
+import csv
+import datetime
+import io
+import itertools
+import json
+import os
+import functools
+import sys
+
+from .academic_calendar import AcademicCalendar, calculate_progress, days_until_graduation
+
+RESULT_FIELDS = ("days_until_graduation", "total_progress", "semester_progress")
+INPUT_FIELDS = ("start_year", "num_courses", "as_of")
+
+
+def detect_format(path, explicit=None):
+    if explicit:
+        return explicit
+    if path and path != "-" and os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return "csv"
+
+
+@functools.lru_cache(maxsize=8)
+def load_calendar(definition):
+    return AcademicCalendar.from_settings(json.loads(definition) if definition else None)
+
+
+def compute_rows(start_years, num_courses, dates, calendar_definition=None):
+    calendar = load_calendar(calendar_definition)
+    try:
+        import numpy as np
+        from .academic_calendar import batch_progress
+    except ImportError:
+        return [
+            (days_until_graduation(int(s), int(n), datetime.date.fromisoformat(d), calendar),)
+            + calculate_progress(int(s), int(n), datetime.date.fromisoformat(d), calendar)
+            for s, n, d in zip(start_years, num_courses, dates)
+        ]
+    days_left, total_progress, semester_progress = batch_progress(
+        np.array(start_years, dtype=np.int64),
+        np.array(num_courses, dtype=np.int64),
+        np.array(dates, dtype="datetime64[D]"),
+        calendar,
+    )
+    return zip(days_left.tolist(), total_progress.tolist(), semester_progress.tolist())
+
+
+def process_chunk(chunk, input_format, output_format, fieldnames, default_as_of, calendar_definition=None):
+    # JSONL chunks are raw lines; CSV chunks are rows already parsed by the parent, since a quoted field
+    # may span lines and can't be split on line boundaries.
+    if input_format == "jsonl":
+        records = [json.loads(line) for line in chunk if line.strip()]
+        start_years = [record["start_year"] for record in records]
+        num_courses = [record["num_courses"] for record in records]
+        dates = [record.get("as_of") or default_as_of for record in records]
+    else:
+        records = [row for row in chunk if row]
+        start_year_column = fieldnames.index("start_year")
+        num_courses_column = fieldnames.index("num_courses")
+        as_of_column = fieldnames.index("as_of") if "as_of" in fieldnames else None
+        start_years = [row[start_year_column] for row in records]
+        num_courses = [row[num_courses_column] for row in records]
+        if as_of_column is None:
+            dates = [default_as_of] * len(records)
+        else:
+            dates = [row[as_of_column] or default_as_of for row in records]
+
+    results = compute_rows(start_years, num_courses, dates, calendar_definition)
+
+    out = io.StringIO()
+    if input_format == "csv":
+        kept = [index for index, field in enumerate(fieldnames) if field not in RESULT_FIELDS]
+        if len(kept) == len(fieldnames):
+            rows = (row + list(result) for row, result in zip(records, results))
+        else:
+            rows = ([row[index] for index in kept] + list(result) for row, result in zip(records, results))
+        if output_format == "csv":
+            csv.writer(out, lineterminator="\n").writerows(rows)
+            return out.getvalue()
+        header = [fieldnames[index] for index in kept] + list(RESULT_FIELDS)
+        records = (dict(zip(header, row)) for row in rows)
+    elif output_format == "csv":
+        kept = [field for field in fieldnames if field not in RESULT_FIELDS]
+        for record in records:
+            unknown = record.keys() - set(fieldnames) - set(RESULT_FIELDS)
+            if unknown:
+                raise ValueError(f"Поля {', '.join(sorted(unknown))} нет в первой записи, по которой строится "
+                                 f"заголовок CSV; используйте --output-format jsonl")
+        rows = ([record.get(field, "") for field in kept] + list(result) for record, result in zip(records, results))
+        csv.writer(out, lineterminator="\n").writerows(rows)
+        return out.getvalue()
+    else:
+        records = (dict(record, **dict(zip(RESULT_FIELDS, result))) for record, result in zip(records, results))
+
+    out.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    return out.getvalue()
+
+
+def iter_chunks(items, chunk_size):
+    while True:
+        chunk = list(itertools.islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_progress(args):
+    input_format = detect_format(args.input, args.input_format)
+    output_format = args.output_format or (detect_format(args.output) if args.output != "-" else input_format)
+    default_as_of = (datetime.date.fromisoformat(args.as_of) if args.as_of else datetime.date.today()).isoformat()
+    calendar_definition = None
+    if args.calendar:
+        with open(args.calendar, "r", encoding="utf-8") as file:
+            definition = json.load(file)
+        calendar_definition = json.dumps(definition.get("calendar", definition))
+        load_calendar(calendar_definition)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8", newline="")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    try:
+        lines = iter(source)
+        fieldnames = None
+        if input_format == "csv":
+            lines = csv.reader(source)
+            fieldnames = next(lines, None)
+            if not fieldnames:
+                return 0
+        elif output_format == "csv":
+            lines = itertools.dropwhile(lambda line: not line.strip(), lines)
+            first_line = next(lines, None)
+            if first_line is None:
+                return 0
+            fieldnames = list(json.loads(first_line))
+            fieldnames += [field for field in INPUT_FIELDS if field not in fieldnames]
+            lines = itertools.chain([first_line], lines)
+        if output_format == "csv":
+            csv.writer(target, lineterminator="\n").writerow(
+                [field for field in fieldnames if field not in RESULT_FIELDS] + list(RESULT_FIELDS))
+
+        chunks = iter_chunks(lines, args.chunk_size)
+        job = (input_format, output_format, fieldnames, default_as_of, calendar_definition)
+
+        if args.workers <= 1:
+            for chunk in chunks:
+                target.write(process_chunk(chunk, *job))
+            return 0
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(executor.submit(process_chunk, chunk, *job))
+                if len(pending) >= args.workers * 2:
+                    target.write(pending.popleft().result())
+            while pending:
+                target.write(pending.popleft().result())
+        return 0
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="grassailytimer batch", description="Пакетный расчет прогресса без графического интерфейса")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    progress = subparsers.add_parser("progress", help="Рассчитать дни до выпуска и прогресс для потока студентов")
+    progress.add_argument("input", help="CSV или JSONL со столбцами start_year, num_courses[, as_of]; '-' - stdin")
+    progress.add_argument("-o", "--output", default="-", help="Файл результата; '-' - stdout")
+    progress.add_argument("--input-format", choices=("csv", "jsonl"))
+    progress.add_argument("--output-format", choices=("csv", "jsonl"))
+    progress.add_argument("--as-of", help="Дата расчета (ГГГГ-ММ-ДД) для строк без as_of; по умолчанию сегодня")
+    progress.add_argument("--calendar", help="JSON с описанием календаря или settings.json с ключом calendar")
+    progress.add_argument("--chunk-size", type=int, default=50_000)
+    progress.add_argument("-j", "--workers", type=int, default=1, help="Количество процессов")
+    progress.set_defaults(handler=run_progress)
+
+    snapshot = subparsers.add_parser("snapshot", help="Отрисовать PNG-снимки виджета без экрана (offscreen)")
+    snapshot.add_argument("input", help="CSV или JSONL: profile, as_of и любые ключи настроек "
+                                        "(start_year, num_courses, opacity, ...), background, output; '-' - stdin")
+    snapshot.add_argument("-o", "--output-dir", default=".", help="Папка для PNG")
+    snapshot.add_argument("--input-format", choices=("csv", "jsonl"))
+    snapshot.add_argument("--settings", help="settings.json с профилями, на которые ссылается столбец profile")
+    snapshot.add_argument("--as-of", help="Дата (ГГГГ-ММ-ДД) для строк без as_of; по умолчанию сегодня")
+    snapshot.add_argument("--name-template", default="{index:05d}_{profile}_{as_of}.png",
+                          help="Имя файла для строк без output; поля index, profile, as_of, start_year, num_courses")
+    snapshot.add_argument("-j", "--workers", type=int, default=1, help="Количество процессов")
+    snapshot.set_defaults(handler=run_snapshot)
+    return parser
+
+
+def run_snapshot(args):
+    from .snapshot import run_snapshot
+    return run_snapshot(args)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,336 @@
+import contextlib
+import functools
+import os
+import sys
+import threading
+import time
+
+from .academic_calendar import (AcademicCalendar, DEFAULT_CALENDAR, DEFAULT_CALENDAR_SETTINGS, batch_progress,
+                                calculate_academic_days, calculate_progress, calculate_studied_days, current_term,
+                                days_until_graduation, next_change_date)
+from .deadlines import DeadlineSchedule
+from .trace import traced
+
+DEFAULT_SETTINGS = {
+    "start_year": 0,
+    "num_courses": 0,
+    "opacity": 50,
+    "is_locked": False,
+    "window_x": 50,
+    "window_y": 50,
+    "window_width": 300,
+    "window_height": 180,
+    "background_format": "png",
+    "background_max_bytes": 0,
+}
+DEFAULT_PROFILE_ID = "default"
+BACKGROUND_IMAGE_EXTENSIONS = ("png", "webp", "jpg")
+
+
+def resource_path(relative_path):
+    if hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, relative_path)
+    return os.path.join(os.path.abspath("."), relative_path)
+
+
+def get_settings_path():
+    if sys.platform == "win32":
+        appdata_path = os.getenv('LOCALAPPDATA')
+        if not appdata_path:
+            appdata_path = os.path.expanduser('~')
+        settings_dir = os.path.join(appdata_path, "GrassallyTimer")
+    else:
+        settings_dir = os.path.join(os.path.expanduser('~'), ".grassallytimer")
+    os.makedirs(settings_dir, exist_ok=True)
+    return os.path.join(settings_dir, "settings.json")
+
+
+def get_images_dir():
+    if sys.platform == "win32":
+        images_dir = os.path.join(os.getenv("LOCALAPPDATA"), "GrassallyTimer", "images")
+    else:
+        images_dir = os.path.join(os.path.expanduser("~"), ".grassallytimer", "images")
+    os.makedirs(images_dir, exist_ok=True)
+    return images_dir
+
+
+def find_background_image(images_dir, name="background_image"):
+    for extension in BACKGROUND_IMAGE_EXTENSIONS:
+        path = os.path.join(images_dir, f"{name}.{extension}")
+        if os.path.exists(path):
+            return path
+    return os.path.join(images_dir, f"{name}.png")
+
+
+def get_desktop_path():
+    if sys.platform == "win32":
+        desktop_path = os.path.join(os.getenv("USERPROFILE"), "Desktop")
+    else:
+        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
+    return desktop_path
+
+
+@traced("read_settings", "io")
+def read_settings_document(path):
+    import json
+
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as file:
+                document = json.load(file)
+        except ValueError:
+            return {}
+        if isinstance(document, dict):
+            return document
+    return {}
+
+
+def split_profiles(document):
+    if "profiles" not in document:
+        return [dict(DEFAULT_SETTINGS, **dict(document, id=DEFAULT_PROFILE_ID))], {}
+
+    profiles = []
+    seen = set()
+    for number, profile in enumerate(document["profiles"], start=1):
+        profile = dict(DEFAULT_SETTINGS, **profile)
+        profile_id = str(profile.get("id") or (DEFAULT_PROFILE_ID if number == 1 else f"profile{number}"))
+        while profile_id in seen:
+            profile_id += "_"
+        seen.add(profile_id)
+        profile["id"] = profile_id
+        profiles.append(profile)
+    if not profiles:
+        profiles.append(dict(DEFAULT_SETTINGS, id=DEFAULT_PROFILE_ID))
+    shared = {key: value for key, value in document.items() if key != "profiles"}
+    return profiles, shared
+
+
+def load_settings(path, profile_id=None):
+    profiles, _ = split_profiles(read_settings_document(path))
+    for profile in profiles:
+        if profile_id is None or profile["id"] == profile_id:
+            return profile
+    raise KeyError(profile_id)
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="wb", **kwargs):
+    """Открывает временный файл рядом с path и подменяет им path только после успешной записи.
+
+    При любой ошибке временный файл удаляется, а прежнее содержимое path остается нетронутым.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    temporary = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temporary, mode, **kwargs) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+@traced("save_settings", "io")
+def save_settings(path, settings):
+    import json
+
+    with atomic_write(path, "w") as file:
+        json.dump(settings, file)
+
+
+class SettingsStore:
+    """Настройки всех профилей в памяти; изменения записываются в файл пачкой через debounce секунд.
+
+    Запись выполняет один фоновый поток, который ждет крайнего срока на условной переменной; каждое
+    изменение только сдвигает срок. Если запись не удалась, изменения остаются несохраненными и записываются
+    вместе со следующим изменением или при close().
+    """
+
+    def __init__(self, path, debounce=0.5):
+        self.path = path
+        self.debounce = debounce
+        self.dirty = set()
+        self.lock = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.deadline = None
+        self.writer = None
+        self.profiles = {}
+        self.saved = {}
+        self.loaded = None
+        self.reload()
+
+    def reload(self, document=None):
+        """Перечитывает файл и возвращает изменившиеся ключи: {id профиля: множество ключей}.
+
+        Несохраненные локальные изменения остаются, если в файле тот же ключ не менялся.
+        """
+        if document is None:
+            document = read_settings_document(self.path)
+        profiles, shared = split_profiles(document)
+        with self.lock:
+            previous = self.profiles
+            saved = {profile["id"]: profile for profile in split_profiles(self.saved)[0]}
+            self.loaded = document
+            self.legacy_layout = "profiles" not in document
+            self.shared = shared
+            self.profiles = {profile["id"]: profile for profile in profiles}
+            self.saved = self.document()
+
+            kept = set()
+            for profile_id, key in self.dirty:
+                values = self.profiles.get(profile_id)
+                if values is not None and values.get(key) == saved.get(profile_id, {}).get(key):
+                    values[key] = previous[profile_id][key]
+                    kept.add((profile_id, key))
+            self.dirty = kept
+            if not kept:
+                self.deadline = None
+
+            changes = {}
+            for profile_id, values in self.profiles.items():
+                old = previous.get(profile_id, {})
+                keys = {key for key in values.keys() | old.keys() if values.get(key) != old.get(key)}
+                if keys:
+                    changes[profile_id] = keys
+            return changes
+
+    def reload_if_changed(self):
+        """Перечитывает файл после внешней записи; None, если менять нечего.
+
+        Собственные записи хранилища и уже прочитанный файл пропускаются. Пустой или недописанный
+        файл тоже пропускается, чтобы не сбросить настройки посреди чужой записи.
+        """
+        with self.write_lock:
+            document = read_settings_document(self.path)
+            if not document or document == self.saved or document == self.loaded:
+                return None
+            return self.reload(document)
+
+    def profile_ids(self):
+        return list(self.profiles)
+
+    def profile(self, profile_id=None):
+        return ProfileSettings(self, profile_id or next(iter(self.profiles)))
+
+    def document(self):
+        profiles = [dict(profile) for profile in self.profiles.values()]
+        if self.legacy_layout and len(profiles) == 1:
+            profile = profiles[0]
+            del profile["id"]
+            return dict(self.shared, **profile)
+        return dict(self.shared, profiles=profiles)
+
+    def update(self, profile_id, **changes):
+        with self.lock:
+            values = self.profiles[profile_id]
+            for key, value in changes.items():
+                if values.get(key) != value:
+                    values[key] = value
+                    self.dirty.add((profile_id, key))
+            if not self.dirty:
+                return
+            self.deadline = time.monotonic() + self.debounce
+            if self.writer is None:
+                self.writer = threading.Thread(target=self.write_loop, name="grassailytimer-settings", daemon=True)
+                self.writer.start()
+            else:
+                self.lock.notify()
+
+    def write_loop(self):
+        writer = threading.current_thread()
+        while True:
+            with self.lock:
+                while self.writer is writer and (self.deadline is None or self.deadline > time.monotonic()):
+                    self.lock.wait(None if self.deadline is None else self.deadline - time.monotonic())
+                if self.writer is not writer:
+                    return
+                self.deadline = None
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def is_dirty(self):
+        with self.lock:
+            return bool(self.dirty)
+
+    def flush(self):
+        with self.write_lock:
+            with self.lock:
+                if not self.dirty:
+                    return False
+                dirty, self.dirty = self.dirty, set()
+                snapshot = self.document()
+            if snapshot == self.saved:
+                return False
+            try:
+                save_settings(self.path, snapshot)
+            except OSError:
+                with self.lock:
+                    self.dirty |= dirty
+                raise
+            self.saved = snapshot
+            return True
+
+    def close(self):
+        with self.lock:
+            self.deadline = None
+            self.writer = None
+            self.lock.notify()
+        return self.flush()
+
+
+class ProfileSettings:
+    def __init__(self, store, profile_id):
+        self.store = store
+        self.profile_id = profile_id
+
+    def __getitem__(self, key):
+        return self.store.profiles[self.profile_id][key]
+
+    def get(self, key, default=None):
+        return self.store.profiles[self.profile_id].get(key, default)
+
+    def update(self, **changes):
+        self.store.update(self.profile_id, **changes)
+
+    def is_dirty(self):
+        return self.store.is_dirty()
+
+    def close(self):
+        return self.store.close()
+
+
+_calendars = {}
+
+
+def load_calendar(settings):
+    import json
+
+    definition = settings.get("calendar")
+    key = json.dumps(definition, sort_keys=True)
+    calendar = _calendars.get(key)
+    if calendar is None:
+        try:
+            calendar = AcademicCalendar.from_settings(definition)
+        except ValueError:
+            calendar = DEFAULT_CALENDAR
+        calendar = _calendars[key] = calendar
+    return calendar
+
+
+def load_deadlines(settings):
+    try:
+        return DeadlineSchedule.from_settings(settings.get("deadlines"))
+    except ValueError:
+        return DeadlineSchedule()
+
+
+@functools.lru_cache(maxsize=256)
+def profile_snapshot(calendar, start_year, num_courses, today):
+    days_left = days_until_graduation(start_year, num_courses, today, calendar)
+    total_progress, semester_progress = calculate_progress(start_year, num_courses, today, calendar)
+    change_date = next_change_date(start_year, num_courses, today, calendar=calendar)
+    return days_left, total_progress, semester_progress, change_date
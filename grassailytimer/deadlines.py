@@ -0,0 +1,56 @@
+import datetime
+import heapq
+
+
+class DeadlineSchedule:
+    """Именованные сроки в min-куче по дате.
+
+    Куча строится за O(n), ближайший срок - O(1), k ближайших - O(k log k)
+    обходом кучи без ее изменения. Прошедшие сроки вытесняются лениво.
+    """
+
+    def __init__(self, deadlines=()):
+        self.heap = [(date, index, name) for index, (name, date) in enumerate(deadlines)]
+        heapq.heapify(self.heap)
+
+    @classmethod
+    def from_settings(cls, entries):
+        if not entries:
+            return cls()
+        if not isinstance(entries, list):
+            raise ValueError("deadlines должен быть списком")
+        deadlines = []
+        for entry in entries:
+            try:
+                name = str(entry["name"])
+                date = datetime.date.fromisoformat(entry["date"])
+            except (KeyError, TypeError) as error:
+                raise ValueError(f"Некорректный срок: {entry!r}") from error
+            deadlines.append((name, date))
+        return cls(deadlines)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def expire(self, today):
+        while self.heap and self.heap[0][0] < today:
+            heapq.heappop(self.heap)
+
+    def next_deadline(self, today):
+        self.expire(today)
+        if not self.heap:
+            return None
+        date, _, name = self.heap[0]
+        return name, date
+
+    def nearest(self, today, count):
+        self.expire(today)
+        found = []
+        frontier = [(self.heap[0], 0)] if self.heap and count > 0 else []
+        while frontier and len(found) < count:
+            (date, _, name), index = heapq.heappop(frontier)
+            found.append((name, date))
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self.heap):
+                    heapq.heappush(frontier, (self.heap[child], child))
+        return found
@@ -0,0 +1,133 @@
+from PyQt6.QtCore import QObject, QPoint, QTimer, Qt
+from PyQt6.QtGui import QGuiApplication
+
+from .trace import traced
+
+
+class ScreenGeometryCache(QObject):
+    DEFAULT_REFRESH_RATE = 60.0
+
+    shared = None
+
+    @classmethod
+    def instance(cls):
+        if cls.shared is None:
+            cls.shared = cls(QGuiApplication.instance())
+        return cls.shared
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rects = None
+        self.frame_interval = None
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self.on_screen_added)
+        app.screenRemoved.connect(self.invalidate)
+        app.primaryScreenChanged.connect(self.invalidate)
+        for screen in app.screens():
+            self.watch(screen)
+
+    def watch(self, screen):
+        screen.geometryChanged.connect(self.invalidate)
+        screen.availableGeometryChanged.connect(self.invalidate)
+        screen.refreshRateChanged.connect(self.invalidate)
+
+    def on_screen_added(self, screen):
+        self.watch(screen)
+        self.invalidate()
+
+    def invalidate(self, *args):
+        self.rects = None
+        self.frame_interval = None
+
+    def available_rects(self):
+        if self.rects is None:
+            self.rects = [screen.availableGeometry() for screen in QGuiApplication.screens()]
+        return self.rects
+
+    def frame_interval_ms(self):
+        if self.frame_interval is None:
+            rates = [screen.refreshRate() for screen in QGuiApplication.screens()]
+            self.frame_interval = max(1, int(1000 / max([rate for rate in rates if rate > 0],
+                                                        default=self.DEFAULT_REFRESH_RATE)))
+        return self.frame_interval
+
+    def screen_rect_for(self, point):
+        rects = self.available_rects()
+        if not rects:
+            return None
+        for rect in rects:
+            if rect.contains(point):
+                return rect
+
+        def distance(rect):
+            dx = max(rect.left() - point.x(), 0, point.x() - rect.right())
+            dy = max(rect.top() - point.y(), 0, point.y() - rect.bottom())
+            return dx * dx + dy * dy
+        return min(rects, key=distance)
+
+    def place(self, pos, size, snap_distance=0):
+        rect = self.screen_rect_for(pos + QPoint(size.width() // 2, size.height() // 2))
+        if rect is None:
+            return pos
+        left, top = rect.left(), rect.top()
+        right = rect.left() + rect.width() - size.width()
+        bottom = rect.top() + rect.height() - size.height()
+
+        x = max(left, min(pos.x(), right))
+        y = max(top, min(pos.y(), bottom))
+        if snap_distance:
+            for edge in (left, right):
+                if abs(x - edge) <= snap_distance:
+                    x = edge
+            for edge in (top, bottom):
+                if abs(y - edge) <= snap_distance:
+                    y = edge
+        return QPoint(x, y)
+
+
+class DragController(QObject):
+    SNAP_DISTANCE = 12
+
+    def __init__(self, widget):
+        super().__init__(widget)
+        self.widget = widget
+        self.screens = ScreenGeometryCache.instance()
+        self.offset = None
+        self.pending = None
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.frame_timer.timeout.connect(self.on_frame)
+
+    def start(self, global_pos):
+        self.offset = global_pos - self.widget.frameGeometry().topLeft()
+        self.pending = None
+
+    def is_dragging(self):
+        return self.offset is not None
+
+    def move_to(self, global_pos):
+        if self.offset is None:
+            return
+        self.pending = global_pos - self.offset
+        if not self.frame_timer.isActive():
+            self.apply()
+            self.frame_timer.start(self.screens.frame_interval_ms())
+
+    def on_frame(self):
+        if self.pending is not None:
+            self.apply()
+            self.frame_timer.start(self.screens.frame_interval_ms())
+
+    @traced("drag_apply", "animation")
+    def apply(self):
+        pos = self.screens.place(self.pending, self.widget.size(), self.SNAP_DISTANCE)
+        self.pending = None
+        if pos != self.widget.pos():
+            self.widget.move(pos)
+
+    def finish(self):
+        self.frame_timer.stop()
+        if self.pending is not None:
+            self.apply()
+        self.offset = None
@@ -0,0 +1,1125 @@
+import datetime
+import math
+import os
+import sys
+import time
+from PyQt6.QtWidgets import (QApplication, QGraphicsOpacityEffect, QLabel, QWidget, QPushButton,
+                             QSlider, QVBoxLayout, QHBoxLayout, QLineEdit, QFileDialog)
+from PyQt6.QtCore import (Qt, QTimer, QPoint, QPropertyAnimation, QEasingCurve, QSize, QObject, pyqtSignal,
+                          QAbstractNativeEventFilter, QThreadPool, QRect, QRectF, QPointF, QEvent)
+from PyQt6.QtGui import (QColor, QFont, QImage, QIntValidator, QPainter, QPainterPath, QPalette, QPen, QPixmap,
+                         QStaticText, QTransform)
+from .core import (DEFAULT_PROFILE_ID, find_background_image, get_desktop_path, get_images_dir, get_settings_path,
+                   load_calendar, load_deadlines, profile_snapshot, SettingsStore)
+from . import metrics
+from .animations import ButtonPressAnimator
+from .drag import DragController
+from .image_import import BackgroundImportTask
+from .notifications import NotificationQueue
+from .progress_series import load_series, series_path
+from .settings_watcher import SettingsWatcher
+from .single_instance import InstanceServer, forward_to_running_instance
+from .theme import apply_theme, icon
+from .trace import mark, traced
+
+WINDOW_GEOMETRY_KEYS = {"window_x", "window_y", "window_width", "window_height"}
+PROGRESS_KEYS = {"start_year", "num_courses", "calendar", "deadlines"}
+PANEL_KEYS = {"start_year", "num_courses", "opacity"}
+
+DEADLINES_SHOWN = 2
+DEADLINE_URGENT_DAYS = 3
+
+WM_TIMECHANGE = 0x001E
+WM_POWERBROADCAST = 0x0218
+WM_WTSSESSION_CHANGE = 0x02B1
+PBT_APMRESUMESUSPEND = 0x0007
+PBT_APMRESUMEAUTOMATIC = 0x0012
+WTS_SESSION_LOCK = 0x7
+WTS_SESSION_UNLOCK = 0x8
+
+
+class SystemClockEventFilter(QAbstractNativeEventFilter):
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            from ctypes import wintypes
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_TIMECHANGE or (
+                    msg.message == WM_POWERBROADCAST and msg.wParam in (PBT_APMRESUMESUSPEND, PBT_APMRESUMEAUTOMATIC)):
+                self.callback()
+        return False, 0
+
+
+class SessionEventFilter(QAbstractNativeEventFilter):
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            from ctypes import wintypes
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_WTSSESSION_CHANGE and msg.wParam in (WTS_SESSION_LOCK, WTS_SESSION_UNLOCK):
+                self.callback(msg.wParam == WTS_SESSION_LOCK)
+        return False, 0
+
+
+class SessionMonitor(QObject):
+    locked_changed = pyqtSignal(bool)
+
+    shared = None
+
+    @classmethod
+    def instance(cls):
+        if cls.shared is None:
+            cls.shared = cls(QApplication.instance())
+        return cls.shared
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.locked = False
+        self.registered_windows = set()
+        self.native_filter = SessionEventFilter(self.set_locked)
+        QApplication.instance().installNativeEventFilter(self.native_filter)
+        self.watch_session_bus()
+
+    def watch_session_bus(self):
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            from PyQt6.QtDBus import QDBusConnection
+        except ImportError:
+            return
+        bus = QDBusConnection.sessionBus()
+        if bus.isConnected():
+            bus.connect("", "/org/freedesktop/ScreenSaver", "org.freedesktop.ScreenSaver", "ActiveChanged",
+                        self.set_locked)
+        bus = QDBusConnection.systemBus()
+        if bus.isConnected():
+            bus.connect("org.freedesktop.login1", "/org/freedesktop/login1/session/auto",
+                        "org.freedesktop.login1.Session", "Lock", self.on_lock)
+            bus.connect("org.freedesktop.login1", "/org/freedesktop/login1/session/auto",
+                        "org.freedesktop.login1.Session", "Unlock", self.on_unlock)
+
+    def register_window(self, widget):
+        if sys.platform != "win32" or widget in self.registered_windows:
+            return
+        import ctypes
+        ctypes.windll.wtsapi32.WTSRegisterSessionNotification(int(widget.winId()), 0)
+        self.registered_windows.add(widget)
+
+    def on_lock(self, *args):
+        self.set_locked(True)
+
+    def on_unlock(self, *args):
+        self.set_locked(False)
+
+    def set_locked(self, locked):
+        locked = bool(locked)
+        if locked != self.locked:
+            self.locked = locked
+            mark("session_locked" if locked else "session_unlocked", "scheduler")
+            self.locked_changed.emit(locked)
+
+
+class RefreshScheduler(QObject):
+    MAX_SLEEP_MS = 6 * 60 * 60 * 1000
+    PRECISE_SLEEP_MS = 2000
+    CLOCK_JUMP_TOLERANCE = 60
+
+    shared = None
+
+    @classmethod
+    def instance(cls):
+        if cls.shared is None:
+            cls.shared = cls(QApplication.instance())
+        return cls.shared
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.targets = {}
+        self.subscribers = []
+        self.target = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.on_timeout)
+        self.armed_wall = None
+        self.armed_monotonic = None
+
+        self.native_filter = SystemClockEventFilter(self.on_system_clock_changed)
+        QApplication.instance().installNativeEventFilter(self.native_filter)
+        QApplication.instance().applicationStateChanged.connect(self.check_clock)
+        self.watch_system_bus()
+
+    def subscribe(self, callback):
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+        self.cancel(callback)
+
+    def watch_system_bus(self):
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            from PyQt6.QtDBus import QDBusConnection
+        except ImportError:
+            return
+        bus = QDBusConnection.systemBus()
+        if not bus.isConnected():
+            return
+        bus.connect("org.freedesktop.login1", "/org/freedesktop/login1", "org.freedesktop.login1.Manager",
+                    "PrepareForSleep", self.on_prepare_for_sleep)
+        bus.connect("org.freedesktop.timedate1", "/org/freedesktop/timedate1",
+                    "org.freedesktop.DBus.Properties", "PropertiesChanged", self.on_system_clock_changed)
+
+    def on_prepare_for_sleep(self, starting):
+        if not starting:
+            self.on_system_clock_changed()
+
+    def schedule_at(self, callback, target):
+        self.subscribe(callback)
+        self.targets[callback] = target
+        self.arm()
+
+    def cancel(self, callback):
+        self.targets.pop(callback, None)
+        self.arm()
+
+    def arm(self):
+        self.target = min(self.targets.values(), default=None)
+        if self.target is None:
+            self.timer.stop()
+            return
+        remaining_ms = math.ceil((self.target - datetime.datetime.now()).total_seconds() * 1000)
+        self.armed_wall = time.time()
+        self.armed_monotonic = time.monotonic()
+        # Очень грубый таймер округляет срабатывание до секунды и может прийти на полсекунды раньше;
+        # последний короткий отрезок до цели отсчитывается точным таймером, иначе он перезапускается вхолостую.
+        if remaining_ms > self.PRECISE_SLEEP_MS:
+            self.timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        else:
+            self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.start(max(0, min(remaining_ms, self.MAX_SLEEP_MS)))
+
+    def clock_jumped(self):
+        if self.armed_wall is None:
+            return False
+        drift = (time.time() - self.armed_wall) - (time.monotonic() - self.armed_monotonic)
+        return abs(drift) > self.CLOCK_JUMP_TOLERANCE
+
+    def on_timeout(self):
+        if self.clock_jumped():
+            self.on_system_clock_changed()
+            return
+        now = datetime.datetime.now()
+        due = [callback for callback, target in self.targets.items() if target <= now]
+        for callback in due:
+            del self.targets[callback]
+        self.arm()
+        for callback in due:
+            callback()
+
+    def check_clock(self, *args):
+        if self.clock_jumped() or (self.target is not None and datetime.datetime.now() >= self.target):
+            self.on_system_clock_changed()
+
+    def on_system_clock_changed(self, *args):
+        mark("system_clock_changed", "scheduler")
+        if hasattr(time, "tzset"):
+            time.tzset()
+        self.targets.clear()
+        self.arm()
+        for callback in list(self.subscribers):
+            callback()
+
+
+class SettingsPanel(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.settings_container = QVBoxLayout(self)
+        self.settings_container.setContentsMargins(0, 0, 0, 0)
+        self.settings_container.setSpacing(5)
+        self.settings_container.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.start_year_label = QLabel("Год начала:", self)
+        self.start_year_label.setProperty("role", "caption")
+
+        self.start_year_input = QLineEdit(self)
+        self.start_year_input.setValidator(QIntValidator(2000, 2100, self))
+
+        self.num_courses_label = QLabel("Кол-во курсов:", self)
+        self.num_courses_label.setProperty("role", "caption")
+
+        self.num_courses_input = QLineEdit(self)
+        self.num_courses_input.setValidator(QIntValidator(1, 6, self))
+
+        self.input_layout = QHBoxLayout()
+        self.input_layout.setSpacing(10)
+
+        self.settings_container.addLayout(self.input_layout)
+
+        self.input_layout.addWidget(self.start_year_label)
+        self.input_layout.addWidget(self.start_year_input)
+        self.input_layout.addWidget(self.num_courses_label)
+        self.input_layout.addWidget(self.num_courses_input)
+
+        self.slider_label = QLabel("Прозрачность:")
+        self.slider_label.setProperty("role", "caption")
+
+        self.slider = QSlider(Qt.Orientation.Horizontal)
+        self.slider.setMinimum(25)
+        self.slider.setMaximum(60)
+
+        self.slider_group = QHBoxLayout()
+        self.slider_group.setSpacing(10)
+
+        self.settings_container.addLayout(self.slider_group)
+
+        self.slider_group.addWidget(self.slider_label)
+        self.slider_group.addWidget(self.slider)
+
+        self.save_button = QPushButton("Сохранить")
+        self.save_button.setProperty("role", "action")
+
+        self.delete_exit_about_layout = QHBoxLayout()
+        self.delete_exit_about_layout.setSpacing(10)
+
+        self.delete_background_button = QPushButton()
+        self.delete_background_button.setIcon(icon("image_icon_delete.png"))
+        self.delete_background_button.setFixedSize(24, 24)
+        self.delete_background_button.setProperty("role", "icon")
+        self.delete_background_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.delete_background_button.setToolTip("Удалить фон")
+
+        self.exit_button = QPushButton("Закрыть программу")
+        self.exit_button.setProperty("role", "action")
+
+        self.about_button = QPushButton("?")
+        self.about_button.setFixedSize(24, 24)
+        self.about_button.setObjectName("aboutButton")
+        self.about_button.setProperty("role", "icon")
+        self.about_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.about_button.setToolTip("Разработчик программы: Quvgard.")
+
+        self.delete_exit_about_layout.addWidget(self.delete_background_button)
+        self.delete_exit_about_layout.addWidget(self.exit_button)
+        self.delete_exit_about_layout.addWidget(self.about_button)
+
+        self.settings_container.addWidget(self.save_button)
+        self.settings_container.addLayout(self.delete_exit_about_layout)
+
+    def set_values(self, start_year, num_courses, opacity):
+        self.start_year_input.setText(str(start_year) if start_year else "")
+        self.num_courses_input.setText(str(num_courses) if num_courses else "")
+        self.slider.setValue(opacity)
+
+    def values(self):
+        start_year_text = self.start_year_input.text()
+        num_courses_text = self.num_courses_input.text()
+        start_year = int(start_year_text) if start_year_text else 0
+        num_courses = int(num_courses_text) if num_courses_text else 0
+        return start_year, num_courses
+
+
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def background_image_name(profile_id):
+    if profile_id == DEFAULT_PROFILE_ID:
+        return "background_image"
+    return f"background_image_{profile_id}"
+
+
+class Sparkline(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(24)
+        self.series = None
+        self.today = None
+        self.pixmap = None
+
+    def set_series(self, series, today):
+        self.series = series
+        self.today = today
+        self.pixmap = None
+        self.setVisible(series is not None)
+        self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.pixmap = None
+
+    def render_pixmap(self):
+        ratio = self.devicePixelRatioF()
+        self.pixmap = QPixmap(self.size() * ratio)
+        self.pixmap.setDevicePixelRatio(ratio)
+        self.pixmap.fill(Qt.GlobalColor.transparent)
+
+        width, height = self.width() - 2, self.height() - 2
+        values = self.series.sample(max(2, width // 2))
+        elapsed = self.series.elapsed_fraction(self.today)
+        done = QPainterPath()
+        ahead = QPainterPath()
+        for index, value in enumerate(values):
+            fraction = index / (len(values) - 1)
+            point = QPointF(1 + fraction * width, 1 + height - value / 100 * height)
+            for path, active in ((done, fraction <= elapsed), (ahead, fraction >= elapsed)):
+                if active:
+                    if path.elementCount() == 0:
+                        path.moveTo(point)
+                    else:
+                        path.lineTo(point)
+
+        painter = QPainter(self.pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(255, 255, 255, 70), 1))
+        painter.drawPath(ahead)
+        painter.setPen(QPen(QColor(255, 255, 255, 220), 1.5))
+        painter.drawPath(done)
+        painter.end()
+
+    def paintEvent(self, event):
+        if self.series is None:
+            return
+        if self.pixmap is None:
+            self.render_pixmap()
+        QPainter(self).drawPixmap(0, 0, self.pixmap)
+
+
+class StatusDisplay(QWidget):
+    """Строки статуса, каждая в своем QStaticText.
+
+    Строка раскладывается заново только при изменении своего текста, и перерисовывается только ее
+    прямоугольник. Если текст не изменился, set_lines ничего не делает.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.lines = []
+        self.hint = QSize(0, 0)
+
+    def set_lines(self, texts):
+        if len(texts) != len(self.lines):
+            self.lines = [self.prepare(text) for text in texts]
+            self.relayout()
+            return
+        dirty = QRect()
+        for index, text in enumerate(texts):
+            line = self.lines[index]
+            if line[0] == text:
+                continue
+            old_width = line[1].size().width()
+            self.lines[index] = line = self.prepare(text)
+            dirty = dirty.united(self.line_rect(index, max(old_width, line[1].size().width())))
+        if not dirty.isNull():
+            if self.measure() != self.hint:
+                self.relayout()
+            else:
+                self.update(dirty)
+
+    def text(self):
+        return "\n".join(text for text, _ in self.lines)
+
+    def prepare(self, text):
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.prepare(QTransform(), self.font())
+        return text, static_text
+
+    def measure(self):
+        width = max((int(static_text.size().width()) + 1 for _, static_text in self.lines), default=0)
+        return QSize(width, self.fontMetrics().lineSpacing() * len(self.lines))
+
+    def relayout(self):
+        self.hint = self.measure()
+        self.updateGeometry()
+        self.update()
+
+    def line_rect(self, index, width):
+        line_height = self.fontMetrics().lineSpacing()
+        top = (self.height() - line_height * len(self.lines)) // 2 + index * line_height
+        width = int(width) + 2
+        return QRect((self.width() - width) // 2, top, width, line_height)
+
+    def sizeHint(self):
+        return self.hint
+
+    def minimumSizeHint(self):
+        return self.hint
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            self.lines = [self.prepare(text) for text, _ in self.lines]
+            self.relayout()
+        super().changeEvent(event)
+
+    def paintEvent(self, event):
+        if not self.lines:
+            return
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        clip = event.rect()
+        for index, (_, static_text) in enumerate(self.lines):
+            width = static_text.size().width()
+            rect = self.line_rect(index, width)
+            if rect.intersects(clip):
+                painter.drawStaticText(QPointF((self.width() - width) / 2, rect.top()), static_text)
+
+
+class TransparentWidget(QWidget):
+    def __init__(self, profile_id=None, store=None, today=None, images_dir=None):
+        super().__init__()
+        self.fixed_today = today
+        self.cached_date = None
+        self.cached_days_left = None
+        self.cached_progress = None
+        self.cached_change_date = None
+        self.cached_year_delta = None
+        self.series = None
+        self.series_params = None
+        self.settings_file = store.path if store is not None else get_settings_path()
+        self.store = store or SettingsStore(self.settings_file)
+        self.profile_id = profile_id or self.store.profile_ids()[0]
+        self.images_dir = images_dir or get_images_dir()
+        self.background_name = background_image_name(self.profile_id)
+        self.background_image = find_background_image(self.images_dir, self.background_name)
+        self.import_task = None
+        self.load_settings()
+        self.is_expanded = False
+        self.visibility_blockers = set()
+        self.refresh_pending = False
+        self.button_animators = []
+        self.animation = None
+        self.settings_panel = None
+        self.notification_label = None
+        self.notifications = None
+        self.initUI()
+        self.refresh_scheduler = RefreshScheduler.instance()
+        self.refresh_scheduler.subscribe(self.on_refresh_due)
+        self.session_monitor = SessionMonitor.instance()
+        self.session_monitor.locked_changed.connect(self.on_session_locked)
+        if self.session_monitor.locked:
+            self.visibility_blockers.add("locked")
+        self.update_info()
+        self.drag_controller = DragController(self)
+        self.is_closing = False
+
+    def initUI(self):
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.Tool |
+            Qt.WindowType.WindowStaysOnBottomHint
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        apply_theme()
+        self.setGeometry(self.window_x, self.window_y, self.window_width, self.window_height)
+
+        self.background_source = None
+        self.background_pixmap = None
+        self.background_shape_path = None
+        self.background_shape_size = None
+        self.load_background_image()
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(10, 10, 10, 10)
+        self.layout.setSpacing(5)
+
+        self.top_bar = QHBoxLayout()
+        self.top_bar.setAlignment(Qt.AlignmentFlag.AlignRight)
+
+        self.background_button = QPushButton()
+        self.background_button.setIcon(icon("image_icon.png"))
+        self.background_button.setFixedSize(24, 24)
+        self.background_button.setProperty("role", "icon")
+        self.background_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.background_button.setToolTip("Добавить фон")
+        self.background_button.clicked.connect(self.change_background_image)
+        self.top_bar.addWidget(self.background_button)
+
+        self.pin_button = QPushButton()
+        if self.is_locked:
+            self.pin_button.setIcon(icon("pin_icon_rotated.png"))
+        else:
+            self.pin_button.setIcon(icon("pin_icon_normal.png"))
+
+        self.pin_button.setFixedSize(24, 24)
+        self.pin_button.setProperty("role", "icon")
+        self.pin_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.pin_button.clicked.connect(self.toggle_lock)
+        self.top_bar.addWidget(self.pin_button)
+
+        self.settings_button = QPushButton()
+        self.settings_button.setIcon(icon("settings_icon.png"))
+        self.settings_button.setFixedSize(24, 24)
+        self.settings_button.setProperty("role", "icon")
+        self.settings_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.settings_button.clicked.connect(self.toggle_settings)
+        self.top_bar.addWidget(self.settings_button)
+
+        self.label = StatusDisplay()
+        self.label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        self.label.setObjectName("statusLabel")
+
+        self.layout.addLayout(self.top_bar)
+        self.layout.addWidget(self.label)
+
+        self.deadline_label = QLabel()
+        self.deadline_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.deadline_label.setFont(QFont("Arial", 9))
+        self.deadline_label.setObjectName("deadlineLabel")
+        self.deadline_label.setVisible(False)
+        self.layout.addWidget(self.deadline_label)
+
+        self.sparkline = Sparkline(self)
+        self.sparkline.setVisible(False)
+        self.layout.addWidget(self.sparkline)
+
+        self.setup_button_animations([self.settings_button, self.pin_button, self.background_button])
+
+    def ensure_settings_panel(self):
+        if self.settings_panel is not None:
+            return self.settings_panel
+
+        self.settings_panel = SettingsPanel(self)
+        self.settings_panel.setVisible(False)
+        self.settings_panel.set_values(self.start_year, self.num_courses, self.opacity)
+        self.settings_panel.slider.valueChanged.connect(self.change_opacity)
+        self.settings_panel.save_button.clicked.connect(self.save_settings_to_file)
+        self.settings_panel.delete_background_button.clicked.connect(self.delete_background)
+        self.settings_panel.exit_button.clicked.connect(self.close)
+        self.layout.addWidget(self.settings_panel)
+
+        self.setup_button_animations([
+            self.settings_panel.save_button,
+            self.settings_panel.exit_button,
+            self.settings_panel.delete_background_button,
+        ])
+        return self.settings_panel
+
+    def ensure_notification_label(self):
+        if self.notification_label is not None:
+            return self.notification_label
+
+        self.notification_label = QLabel("Настройки сохранены", self)
+        self.notification_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.notification_label.setFont(QFont("Arial", 8))
+        self.notification_label.setObjectName("notificationLabel")
+        self.notification_label.setFixedSize(200, 30)
+        self.notification_label.move(10, 10)
+        self.notification_label.hide()
+        self.notifications = NotificationQueue(self.notification_label)
+        return self.notification_label
+
+    def setup_button_animations(self, buttons):
+        for button in buttons:
+            self.button_animators.append(ButtonPressAnimator(button))
+
+    def show_notification(self, message):
+        self.ensure_notification_label()
+        self.notifications.push(message)
+
+    def load_settings(self):
+        self.settings = self.store.profile(self.profile_id)
+        self.read_settings()
+
+    def read_settings(self, keys=None):
+        settings = self.settings
+        self.start_year = settings["start_year"] or None
+        self.num_courses = settings["num_courses"] or None
+        self.opacity = settings["opacity"]
+        self.is_locked = settings["is_locked"]
+        self.window_x = settings["window_x"]
+        self.window_y = settings["window_y"]
+        self.window_width = settings["window_width"]
+        self.window_height = settings["window_height"]
+        if keys is None or "calendar" in keys:
+            self.calendar = load_calendar(settings)
+        if keys is None or "deadlines" in keys:
+            self.deadlines = load_deadlines(settings)
+        self.background_format = settings["background_format"]
+        self.background_max_bytes = settings["background_max_bytes"]
+
+    @traced("reload_settings", "io")
+    def reload_settings(self, keys=None):
+        self.read_settings(keys)
+        if keys is None or keys & WINDOW_GEOMETRY_KEYS:
+            height = self.window_height + 100 if self.is_expanded else self.window_height
+            self.setGeometry(self.window_x, self.window_y, self.window_width, height)
+        if keys is None or "is_locked" in keys:
+            if self.is_locked:
+                self.pin_button.setIcon(icon("pin_icon_rotated.png"))
+            else:
+                self.pin_button.setIcon(icon("pin_icon_normal.png"))
+        if self.settings_panel is not None and (keys is None or keys & PANEL_KEYS):
+            self.settings_panel.set_values(self.start_year, self.num_courses, self.opacity)
+        if keys is None or "opacity" in keys:
+            self.background_pixmap = None
+            self.update()
+        if keys is None or keys & PROGRESS_KEYS:
+            self.cached_date = None
+            self.update_info()
+
+    def refresh_background(self):
+        if self.import_task is not None:
+            return
+        path = find_background_image(self.images_dir, self.background_name)
+        if path != self.background_image or file_signature(path) != self.background_signature:
+            self.background_image = path
+            self.load_background_image()
+
+    def save_settings_to_file(self):
+        if self.apply_settings_input():
+            self.show_notification("Настройки сохранены")
+            self.update_info()
+
+    def apply_settings_input(self):
+        if self.settings_panel is None:
+            return True
+
+        try:
+            start_year, num_courses = self.settings_panel.values()
+        except ValueError:
+            self.show_notification("Введите корректные числа")
+            return False
+
+        if start_year != 0 and (start_year < 2000 or start_year > 2100):
+            self.show_notification("Введите корректный год")
+            return False
+
+        if num_courses != 0 and (num_courses < 1 or num_courses > 6):
+            self.show_notification("Введите корректное кол-во курсов")
+            return False
+
+        self.settings.update(start_year=start_year, num_courses=num_courses)
+        self.start_year = start_year if start_year != 0 else None
+        self.num_courses = num_courses if num_courses != 0 else None
+        self.cached_date = None
+        return True
+
+    @traced("update_info")
+    def update_info(self):
+        if self.start_year is None or self.num_courses is None or self.start_year == 0 or self.num_courses == 0:
+            self.refresh_scheduler.cancel(self.on_refresh_due)
+            self.label.set_lines(["Настройте программу", "перед использованием"])
+            self.sparkline.set_series(None, None)
+            self.deadline_label.setVisible(False)
+            metrics.discard(self.profile_id)
+            return
+
+        today = self.fixed_today or datetime.date.today()
+
+        if self.cached_date == today:
+            days_left = self.cached_days_left
+            total_progress, semester_progress = self.cached_progress
+        else:
+            days_left, total_progress, semester_progress, self.cached_change_date = profile_snapshot(
+                self.calendar, self.start_year, self.num_courses, today)
+
+            self.cached_days_left = days_left
+            self.cached_progress = (total_progress, semester_progress)
+            self.cached_date = today
+
+            series = self.progress_series()
+            year_ago = series.lookup(today - datetime.timedelta(days=365)) if series is not None else None
+            self.cached_year_delta = total_progress - year_ago[0] if year_ago is not None else None
+            self.sparkline.set_series(series, today)
+            self.show_deadlines(self.deadlines.nearest(today, DEADLINES_SHOWN), today)
+            metrics.publish(self.profile_id, {
+                "as_of": today.isoformat(),
+                "days_until_graduation": days_left,
+                "total_progress": round(total_progress, 4),
+                "semester_progress": round(semester_progress, 4),
+            })
+
+        change_date = self.cached_change_date
+        if self.deadlines.next_deadline(today) is not None:
+            # Обратный отсчет до ближайшего срока меняется каждый день, а после срока строка пропадает.
+            tomorrow = today + datetime.timedelta(days=1)
+            change_date = min(change_date, tomorrow) if change_date is not None else tomorrow
+
+        if change_date is None or self.fixed_today is not None:
+            self.refresh_scheduler.cancel(self.on_refresh_due)
+        else:
+            self.refresh_scheduler.schedule_at(self.on_refresh_due,
+                                               datetime.datetime.combine(change_date, datetime.time()))
+
+        lines = [f"До выпуска: {days_left} дней", f"Прогресс: {total_progress:.2f}%",
+                 f"Семестр: {semester_progress:.2f}%"]
+        if self.cached_year_delta:
+            lines.append(f"За год: +{self.cached_year_delta:.2f}%")
+        self.label.set_lines(lines)
+
+    def show_deadlines(self, deadlines, today):
+        lines = []
+        for name, date in deadlines:
+            days = (date - today).days
+            lines.append(f"{name}: сегодня" if days == 0 else f"{name}: через {days} дн. ({date:%d.%m})")
+        self.deadline_label.setText("\n".join(lines))
+        urgent = bool(deadlines) and (deadlines[0][1] - today).days <= DEADLINE_URGENT_DAYS
+        if self.deadline_label.property("urgent") != urgent:
+            self.deadline_label.setProperty("urgent", urgent)
+            self.deadline_label.style().unpolish(self.deadline_label)
+            self.deadline_label.style().polish(self.deadline_label)
+        self.deadline_label.setVisible(bool(deadlines))
+
+    def progress_series(self):
+        params = (self.start_year, self.num_courses, self.calendar)
+        if self.series_params != params:
+            if self.series is not None:
+                self.series.close()
+                self.series = None
+            try:
+                self.series = load_series(series_path(self.settings_file, self.profile_id), self.start_year,
+                                          self.num_courses, self.settings.get("calendar"), self.calendar)
+            except (OSError, ValueError):
+                self.series = None
+            self.series_params = params
+        return self.series
+
+    def on_refresh_due(self):
+        if self.visibility_blockers:
+            self.refresh_pending = True
+        else:
+            self.update_info()
+
+    def on_session_locked(self, locked):
+        self.set_visibility_blocker("locked", locked)
+
+    def set_visibility_blocker(self, reason, active):
+        was_suspended = bool(self.visibility_blockers)
+        if active:
+            self.visibility_blockers.add(reason)
+        else:
+            self.visibility_blockers.discard(reason)
+        if self.is_closing or was_suspended == bool(self.visibility_blockers):
+            return
+        if self.visibility_blockers:
+            self.suspend()
+        else:
+            self.resume()
+
+    def suspend(self):
+        mark("suspend", "scheduler")
+        if self.animation is not None and self.animation.state() == QPropertyAnimation.State.Running:
+            self.animation.setCurrentTime(self.animation.totalDuration())
+        if self.notifications is not None:
+            self.notifications.settle()
+        for animator in self.button_animators:
+            animator.settle()
+
+    def resume(self):
+        mark("resume", "scheduler")
+        if self.refresh_pending:
+            self.refresh_pending = False
+            self.update_info()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        window = self.windowHandle()
+        if window is not None and not window.property("grassailytimer_watched"):
+            window.installEventFilter(self)
+            window.setProperty("grassailytimer_watched", True)
+        self.session_monitor.register_window(self)
+        self.set_visibility_blocker("hidden", False)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not event.spontaneous():
+            self.set_visibility_blocker("hidden", True)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.set_visibility_blocker("minimized", self.isMinimized())
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Expose and watched is self.windowHandle():
+            self.set_visibility_blocker("obscured", not watched.isExposed())
+        return super().eventFilter(watched, event)
+
+    @traced("toggle_settings", "animation")
+    def toggle_settings(self):
+        self.is_expanded = not self.is_expanded
+        self.animation = QPropertyAnimation(self, b"size")
+        self.animation.setDuration(300)
+        self.animation.setEasingCurve(QEasingCurve.Type.OutQuad)
+
+        if self.is_expanded:
+            self.animation.setEndValue(QSize(self.width(), self.window_height + 100))
+        else:
+            self.animation.setEndValue(QSize(self.window_width, self.window_height))
+
+        self.animation.start()
+
+        if self.is_expanded:
+            self.ensure_settings_panel()
+        if self.settings_panel is not None:
+            self.settings_panel.setVisible(self.is_expanded)
+
+        QApplication.processEvents()
+
+    def toggle_lock(self):
+        self.is_locked = not self.is_locked
+        self.settings.update(is_locked=self.is_locked)
+        if self.is_locked:
+            self.pin_button.setIcon(icon("pin_icon_rotated.png"))
+        else:
+            self.pin_button.setIcon(icon("pin_icon_normal.png"))
+
+    @traced("change_opacity")
+    def change_opacity(self, value):
+        self.opacity = value
+        self.settings.update(opacity=value)
+        self.update()
+        self.background_pixmap = None
+
+    def change_background_image(self):
+        if self.import_task is not None:
+            self.show_notification("Изображение уже загружается")
+            return
+
+        desktop_path = get_desktop_path()
+        file_name, _ = QFileDialog.getOpenFileName(
+            self,
+            "Выберите фоновое изображение",
+            desktop_path,
+            "Images (*.png *.jpg *.jpeg *.bmp *.webp)"
+        )
+        if file_name:
+            self.import_task = BackgroundImportTask(file_name, self.images_dir, self.background_name,
+                                                    image_format=self.background_format,
+                                                    size_budget=self.background_max_bytes)
+            self.import_task.signals.progress.connect(self.on_background_import_progress)
+            self.import_task.signals.finished.connect(self.on_background_imported)
+            self.import_task.signals.failed.connect(self.on_background_import_failed)
+            self.background_button.setEnabled(False)
+            self.show_notification("Загрузка изображения...")
+            QThreadPool.globalInstance().start(self.import_task)
+
+    def on_background_import_progress(self, percent):
+        if self.notifications is not None:
+            self.notifications.replace(f"Загрузка изображения: {percent}%")
+
+    def on_background_imported(self, path):
+        self.import_task = None
+        self.background_button.setEnabled(True)
+        self.background_image = path
+        self.load_background_image()
+        self.show_notification("Фоновое изображение обновлено")
+
+    def on_background_import_failed(self, message):
+        self.import_task = None
+        self.background_button.setEnabled(True)
+        self.show_notification(message)
+
+    def delete_background(self):
+        if os.path.exists(self.background_image):
+            os.remove(self.background_image)
+            self.show_notification("Фоновое изображение удалено")
+            self.load_background_image()
+        else:
+            self.show_notification("Фоновое изображение отсутствует")
+
+    def load_background_image(self):
+        self.background_signature = file_signature(self.background_image)
+        image = QImage(self.background_image) if self.background_signature is not None else QImage()
+        if image.isNull():
+            self.background_source = None
+        else:
+            self.background_source = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        self.background_pixmap = None
+        self.update()
+
+    def background_frame(self):
+        if self.background_pixmap is None and self.background_source is not None:
+            baked = QImage(self.background_source.size(), QImage.Format.Format_ARGB32_Premultiplied)
+            baked.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(baked)
+            painter.setOpacity(self.opacity / 100.0)
+            painter.drawImage(0, 0, self.background_source)
+            painter.end()
+            self.background_pixmap = QPixmap.fromImage(baked)
+        return self.background_pixmap
+
+    def background_shape(self):
+        if self.background_shape_size != self.size():
+            self.background_shape_path = QPainterPath()
+            self.background_shape_path.addRoundedRect(QRectF(self.rect()), 10, 10)
+            self.background_shape_size = self.size()
+        return self.background_shape_path
+
+    @traced("paint", "paint")
+    def paintEvent(self, event):
+        shape = self.background_shape()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setClipRect(event.rect())
+        painter.fillPath(shape, QColor(0, 0, 0, round(self.opacity * 2.55)))
+
+        frame = self.background_frame()
+        if frame is not None:
+            top_left = QPoint((self.width() - frame.width()) // 2, (self.height() - frame.height()) // 2)
+            if event.rect().intersects(frame.rect().translated(top_left)):
+                painter.setClipPath(shape, Qt.ClipOperation.IntersectClip)
+                painter.drawPixmap(top_left, frame)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and not self.is_locked:
+            self.drag_controller.start(event.globalPosition().toPoint())
+            event.accept()
+
+    @traced("drag_move", "animation")
+    def mouseMoveEvent(self, event):
+        if event.buttons() == Qt.MouseButton.LeftButton and not self.is_locked:
+            self.drag_controller.move_to(event.globalPosition().toPoint())
+            event.accept()
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self.drag_controller.is_dragging():
+            self.drag_controller.finish()
+            event.accept()
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self.settings.update(window_x=self.x(), window_y=self.y())
+
+    def closeEvent(self, event):
+        if self.is_closing:
+            event.accept()
+            return
+
+        self.is_closing = True
+        self.apply_settings_input()
+        self.refresh_scheduler.unsubscribe(self.on_refresh_due)
+        try:
+            self.settings.close()
+        except OSError as error:
+            if sys.stderr is not None:
+                print(f"Не удалось сохранить настройки в {self.settings_file}: {error}", file=sys.stderr)
+
+        # Qt can't paint a graphics effect nested inside another one, so clear the children's effects first.
+        if self.notifications is not None:
+            self.notifications.settle()
+        for animator in self.button_animators:
+            animator.settle()
+
+        self.opacity_effect = QGraphicsOpacityEffect(self)
+        self.setGraphicsEffect(self.opacity_effect)
+
+        self.animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        self.animation.setDuration(500)
+        self.animation.setStartValue(1.0)
+        self.animation.setEndValue(0.0)
+        self.animation.setEasingCurve(QEasingCurve.Type.OutQuad)
+
+        self.animation.finished.connect(self.finish_close)
+        self.animation.start()
+
+        event.ignore()
+
+    def dispose(self):
+        self.refresh_scheduler.unsubscribe(self.on_refresh_due)
+        metrics.discard(self.profile_id)
+        if self.series is not None:
+            self.series.close()
+            self.series = None
+        self.hide()
+        self.deleteLater()
+
+    def finish_close(self):
+        QTimer.singleShot(100, QApplication.instance().quit)
+
+class ProfileWindows(QObject):
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.widgets = {}
+        self.watcher = None
+
+    def open_all(self):
+        for profile_id in self.store.profile_ids():
+            widget = self.widgets.get(profile_id)
+            if widget is None:
+                widget = self.widgets[profile_id] = TransparentWidget(profile_id, self.store)
+            widget.show()
+            widget.raise_()
+
+    def watch(self, images_dir):
+        self.watcher = SettingsWatcher(self.store.path, images_dir, self)
+        self.watcher.settings_changed.connect(self.on_settings_file_changed)
+        self.watcher.images_changed.connect(self.on_images_changed)
+
+    def reload(self, changes=None):
+        if changes is None:
+            changes = self.store.reload()
+        for profile_id, widget in list(self.widgets.items()):
+            if profile_id not in self.store.profiles:
+                del self.widgets[profile_id]
+                widget.dispose()
+            elif profile_id in changes:
+                widget.reload_settings(changes[profile_id])
+        for profile_id in self.store.profile_ids():
+            if profile_id not in self.widgets:
+                self.widgets[profile_id] = TransparentWidget(profile_id, self.store)
+                self.widgets[profile_id].show()
+
+    def on_settings_file_changed(self):
+        changes = self.store.reload_if_changed()
+        if changes is not None:
+            self.reload(changes)
+
+    def on_images_changed(self):
+        for widget in self.widgets.values():
+            widget.refresh_background()
+
+    def open_settings(self):
+        self.open_all()
+        widget = next(iter(self.widgets.values()))
+        if not widget.is_expanded:
+            widget.toggle_settings()
+
+    def handle_command(self, command):
+        if command == "show":
+            self.open_all()
+        elif command == "reload":
+            self.reload()
+            self.open_all()
+        elif command == "settings":
+            self.open_settings()
+
+
+def run(argv=None, commands=(), metrics_port=None):
+    app = QApplication(sys.argv[:1] + list(argv or []))
+    server = InstanceServer(app)
+    if not server.listen() and forward_to_running_instance(commands or ["show"]):
+        return 0
+    app.aboutToQuit.connect(server.close)
+
+    if metrics_port is not None:
+        metrics_server = metrics.MetricsServer(metrics.enable(), metrics_port)
+        try:
+            metrics_server.start()
+            app.aboutToQuit.connect(metrics_server.close)
+        except OSError as error:
+            if sys.stderr is not None:
+                print(f"Не удалось открыть порт метрик {metrics_port}: {error}", file=sys.stderr)
+
+    windows = ProfileWindows(SettingsStore(get_settings_path()), app)
+    server.command_received.connect(windows.handle_command)
+    windows.open_all()
+    windows.watch(get_images_dir())
+    if "settings" in commands:
+        windows.open_settings()
+    return app.exec()
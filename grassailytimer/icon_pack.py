@@ -0,0 +1,113 @@
+import os
+import struct
+import sys
+
+from .core import atomic_write
+
+PACK_MAGIC = b"GTIC"
+PACK_VERSION = 1
+PACK_PATH = "assets/icons.bin"
+HEADER = struct.Struct("<4sHH")
+ENTRY = struct.Struct("<32sHHII")
+
+ICON_SIZE = 16
+ICON_SCALES = (1, 1.25, 1.5, 2, 3)
+ICON_NAMES = (
+    "image_icon.png",
+    "image_icon_delete.png",
+    "pin_icon_normal.png",
+    "pin_icon_rotated.png",
+    "settings_icon.png",
+)
+
+
+class IconPack:
+    """Иконки, заранее уменьшенные до размеров кнопок, в одном файле.
+
+    Файл читается при первом обращении, PNG каждого варианта декодируется только вместе со своей иконкой.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = None
+        self.index = None
+
+    def load(self):
+        if self.index is not None:
+            return
+        self.index = {}
+        try:
+            with open(self.path, "rb") as file:
+                self.data = file.read()
+            magic, version, count = HEADER.unpack_from(self.data)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                raise ValueError(f"{self.path}: неподходящий формат набора иконок")
+            for number in range(count):
+                name, size, scale, offset, length = ENTRY.unpack_from(self.data, HEADER.size + number * ENTRY.size)
+                self.index.setdefault(name.rstrip(b"\0").decode("utf-8"), []).append(
+                    (size, scale / 100, offset, length))
+        except (OSError, ValueError, struct.error):
+            self.data = None
+            self.index = {}
+
+    def variants(self, name):
+        self.load()
+        return [(size, scale, self.data[offset:offset + length])
+                for size, scale, offset, length in self.index.get(name, ())]
+
+
+def render_variants(path, size=ICON_SIZE, scales=ICON_SCALES):
+    from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+    from PyQt6.QtGui import QImage
+
+    source = QImage(path)
+    if source.isNull():
+        raise ValueError(f"Не удалось прочитать {path}")
+    variants = []
+    for scale in scales:
+        pixels = round(size * scale)
+        image = source.scaled(pixels, pixels, Qt.AspectRatioMode.KeepAspectRatio,
+                              Qt.TransformationMode.SmoothTransformation)
+        for key in image.textKeys():
+            image.setText(key, "")
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")
+        buffer.close()
+        variants.append((pixels, round(scale * 100), bytes(data)))
+    return variants
+
+
+def write_pack(path, icons):
+    entries = [(name, pixels, scale, data) for name, variants in icons for pixels, scale, data in variants]
+    offset = HEADER.size + ENTRY.size * len(entries)
+    with atomic_write(path) as file:
+        file.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, len(entries)))
+        for name, pixels, scale, data in entries:
+            file.write(ENTRY.pack(name.encode("utf-8"), pixels, scale, offset, len(data)))
+            offset += len(data)
+        for _, _, _, data in entries:
+            file.write(data)
+
+
+def build_pack(assets_dir, output=None):
+    output = output or os.path.join(assets_dir, os.path.basename(PACK_PATH))
+    write_pack(output, [(name, render_variants(os.path.join(assets_dir, name))) for name in ICON_NAMES])
+    return output
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Собирает уменьшенные иконки из assets/ в один файл.")
+    parser.add_argument("assets_dir", nargs="?", default="assets")
+    parser.add_argument("-o", "--output", help=f"Файл набора (по умолчанию {PACK_PATH})")
+    args = parser.parse_args(argv)
+    output = build_pack(args.assets_dir, args.output)
+    print(f"{output}: {os.path.getsize(output)} байт")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
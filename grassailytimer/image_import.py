@@ -0,0 +1,114 @@
+import os
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRunnable, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QImageReader, QImageWriter
+
+from .core import BACKGROUND_IMAGE_EXTENSIONS, atomic_write
+from .trace import traced
+
+FORMAT_EXTENSIONS = {"png": "png", "webp": "webp", "jpeg": "jpg"}
+MIN_QUALITY = 30
+QUALITY_STEP = 10
+DOWNSCALE_STEP = 0.85
+MIN_SIDE = 64
+
+
+def supported_format(image_format):
+    image_format = "jpeg" if image_format == "jpg" else image_format
+    if image_format not in FORMAT_EXTENSIONS:
+        return "png"
+    if image_format.encode() not in [bytes(name) for name in QImageWriter.supportedImageFormats()]:
+        return "jpeg" if image_format == "webp" else "png"
+    return image_format
+
+
+def encode_image(image, image_format, quality=-1):
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    if not image.save(buffer, image_format.upper(), quality):
+        return None
+    buffer.close()
+    return bytes(data)
+
+
+class ImportSignals(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class BackgroundImportTask(QRunnable):
+    def __init__(self, source, target_dir, target_name="background_image", max_size=QSize(300, 300),
+                 image_format="png", size_budget=0):
+        super().__init__()
+        self.source = source
+        self.target_dir = target_dir
+        self.target_name = target_name
+        self.max_size = max_size
+        self.image_format = supported_format(image_format)
+        self.size_budget = size_budget
+        self.signals = ImportSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(self.import_image())
+        except (OSError, ValueError) as error:
+            self.signals.failed.emit(str(error))
+        except Exception as error:
+            # Без сигнала окно так и осталось бы с заблокированной кнопкой и висящей задачей.
+            self.signals.failed.emit(f"Не удалось загрузить изображение: {error}")
+
+    @traced("import_background", "io")
+    def import_image(self):
+        reader = QImageReader(self.source)
+        reader.setAutoTransform(True)
+        if not reader.canRead():
+            raise ValueError("Не удалось загрузить изображение")
+
+        source_size = reader.size()
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(self.max_size, Qt.AspectRatioMode.KeepAspectRatio))
+        self.signals.progress.emit(10)
+
+        image = reader.read()
+        if image.isNull():
+            raise ValueError("Не удалось загрузить изображение")
+        if image.width() > self.max_size.width() or image.height() > self.max_size.height():
+            image = image.scaled(self.max_size, Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        self.signals.progress.emit(50)
+
+        data = self.encode_within_budget(image)
+        self.signals.progress.emit(90)
+
+        extension = FORMAT_EXTENSIONS[self.image_format]
+        target = os.path.join(self.target_dir, f"{self.target_name}.{extension}")
+        with atomic_write(target) as file:
+            file.write(data)
+
+        for other in BACKGROUND_IMAGE_EXTENSIONS:
+            if other != extension:
+                stale = os.path.join(self.target_dir, f"{self.target_name}.{other}")
+                if os.path.exists(stale):
+                    os.remove(stale)
+        self.signals.progress.emit(100)
+        return target
+
+    def encode_within_budget(self, image):
+        lossless = self.image_format == "png"
+        while True:
+            quality = -1 if lossless else 90
+            while True:
+                data = encode_image(image, self.image_format, quality)
+                if data is None:
+                    raise ValueError("Не удалось сохранить изображение")
+                if not self.size_budget or len(data) <= self.size_budget or lossless or quality <= MIN_QUALITY:
+                    break
+                quality -= QUALITY_STEP
+            if not self.size_budget or len(data) <= self.size_budget:
+                return data
+            if min(image.width(), image.height()) * DOWNSCALE_STEP < MIN_SIDE:
+                return data
+            image = image.scaled(image.size() * DOWNSCALE_STEP, Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
@@ -0,0 +1,188 @@
+import json
+import threading
+import time
+
+from . import trace
+
+DEFAULT_METRICS_PORT = 9477
+COUNTERS_TTL = 1.0
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+registry = None
+
+
+class MetricsRegistry:
+    """Значения профилей и счетчики времени для локального эндпоинта.
+
+    Поток Qt публикует значения только при их изменении. Ответы сериализуются один раз на версию значений
+    и отдаются из кэша; если менялись только счетчики, кэш пересобирается не чаще раза в COUNTERS_TTL.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.profiles = {}
+        self.version = 0
+        self.started = time.monotonic()
+        self.cache = None
+
+    def publish(self, profile_id, values):
+        if self.profiles.get(profile_id) == values:
+            return
+        with self.lock:
+            self.profiles = dict(self.profiles)
+            self.profiles[profile_id] = values
+            self.version += 1
+
+    def discard(self, profile_id):
+        if profile_id not in self.profiles:
+            return
+        with self.lock:
+            self.profiles = {key: value for key, value in self.profiles.items() if key != profile_id}
+            self.version += 1
+
+    def responses(self):
+        now = time.monotonic()
+        cache = self.cache
+        if cache is not None and cache[0] == self.version and now - cache[1] < COUNTERS_TTL:
+            return cache[2], cache[3]
+        with self.lock:
+            version, profiles = self.version, self.profiles
+        timings = {name: tuple(entry) for name, entry in dict(trace.counters or {}).items()}
+        uptime = now - self.started
+        self.cache = (version, now, render_json(profiles, timings, uptime),
+                      render_prometheus(profiles, timings, uptime))
+        return self.cache[2], self.cache[3]
+
+
+def render_json(profiles, timings, uptime):
+    report = {
+        "uptime_seconds": round(uptime, 3),
+        "profiles": profiles,
+        "timings": {name: {"count": calls, "total_ms": total / 1e6, "max_ms": longest / 1e6}
+                    for name, (calls, total, longest) in sorted(timings.items())},
+    }
+    return json.dumps(report, ensure_ascii=False).encode("utf-8")
+
+
+def label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(profiles, timings, uptime):
+    lines = [
+        "# HELP grassailytimer_uptime_seconds Время работы виджета.",
+        "# TYPE grassailytimer_uptime_seconds gauge",
+        f"grassailytimer_uptime_seconds {uptime:.3f}",
+        "# HELP grassailytimer_days_until_graduation Дней до выпуска.",
+        "# TYPE grassailytimer_days_until_graduation gauge",
+    ]
+    for profile_id, values in sorted(profiles.items()):
+        lines.append(f'grassailytimer_days_until_graduation{{profile="{label(profile_id)}"}} '
+                     f'{values["days_until_graduation"]}')
+    lines += [
+        "# HELP grassailytimer_progress_percent Прогресс обучения в процентах.",
+        "# TYPE grassailytimer_progress_percent gauge",
+    ]
+    for profile_id, values in sorted(profiles.items()):
+        for scope in ("total", "semester"):
+            lines.append(f'grassailytimer_progress_percent{{profile="{label(profile_id)}",scope="{scope}"}} '
+                         f'{values[f"{scope}_progress"]}')
+    lines += [
+        "# HELP grassailytimer_call_seconds Длительность вызовов горячих путей виджета.",
+        "# TYPE grassailytimer_call_seconds summary",
+    ]
+    for name, (calls, total, _) in sorted(timings.items()):
+        lines.append(f'grassailytimer_call_seconds_count{{name="{label(name)}"}} {calls}')
+        lines.append(f'grassailytimer_call_seconds_sum{{name="{label(name)}"}} {total / 1e9:.9f}')
+    lines += [
+        "# HELP grassailytimer_call_max_seconds Самый долгий вызов.",
+        "# TYPE grassailytimer_call_max_seconds gauge",
+    ]
+    for name, (_, _, longest) in sorted(timings.items()):
+        lines.append(f'grassailytimer_call_max_seconds{{name="{label(name)}"}} {longest / 1e9:.9f}')
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def port_from(value):
+    return int(value) if value and value.isdigit() else DEFAULT_METRICS_PORT
+
+
+def enable():
+    global registry
+    trace.enable_counters()
+    if registry is None:
+        registry = MetricsRegistry()
+    return registry
+
+
+def enabled():
+    return registry is not None
+
+
+def publish(profile_id, values):
+    if registry is not None:
+        registry.publish(profile_id, values)
+
+
+def discard(profile_id):
+    if registry is not None:
+        registry.discard(profile_id)
+
+
+class MetricsServer:
+    """HTTP-сервер только для чтения на 127.0.0.1: /metrics в формате Prometheus, /status в JSON.
+
+    Работает в своих потоках и читает только кэш реестра, не обращаясь к виджетам.
+    """
+
+    def __init__(self, metrics_registry, port=DEFAULT_METRICS_PORT, host="127.0.0.1"):
+        self.registry = metrics_registry
+        self.address = (host, port)
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics_registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status_body, prometheus_body = metrics_registry.responses()
+                path = self.path.split("?", 1)[0]
+                if path == "/metrics":
+                    self.reply(200, PROMETHEUS_CONTENT_TYPE, prometheus_body)
+                elif path in ("/", "/status"):
+                    self.reply(200, "application/json; charset=utf-8", status_body)
+                else:
+                    self.reply(404, "text/plain; charset=utf-8", b"not found\n")
+
+            def do_HEAD(self):
+                self.do_GET()
+
+            def reply(self, code, content_type, body):
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(self.address, Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name="grassailytimer-metrics", daemon=True)
+        self.thread.start()
+        return self.server.server_address[1]
+
+    def close(self):
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
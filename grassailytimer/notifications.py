@@ -0,0 +1,84 @@
+import collections
+
+from PyQt6.QtCore import (QAbstractAnimation, QEasingCurve, QObject, QPauseAnimation, QPropertyAnimation,
+                          QSequentialAnimationGroup)
+from PyQt6.QtWidgets import QGraphicsOpacityEffect
+
+from .trace import traced
+
+
+class NotificationQueue(QObject):
+    """Всплывающие уведомления по очереди в одной метке.
+
+    Появление, показ и исчезновение - одна последовательная группа анимаций, созданная один раз. Повтор
+    текущего сообщения продлевает показ, повтор ожидающего не добавляется; при переполнении очереди
+    вытесняются самые старые сообщения.
+    """
+
+    FADE_DURATION = 500
+    HOLD_DURATION = 2000
+    OPACITY = 0.8
+    MAX_PENDING = 3
+
+    def __init__(self, label):
+        super().__init__(label)
+        self.label = label
+        self.current = None
+        self.pending = collections.deque(maxlen=self.MAX_PENDING)
+
+        self.effect = QGraphicsOpacityEffect(label)
+        self.effect.setOpacity(0.0)
+        label.setGraphicsEffect(self.effect)
+
+        self.fade_in = QPropertyAnimation(self.effect, b"opacity", self)
+        self.fade_in.setStartValue(0.0)
+        self.fade_in.setEndValue(self.OPACITY)
+        self.hold = QPauseAnimation(self.HOLD_DURATION, self)
+        self.fade_out = QPropertyAnimation(self.effect, b"opacity", self)
+        self.fade_out.setStartValue(self.OPACITY)
+        self.fade_out.setEndValue(0.0)
+
+        self.group = QSequentialAnimationGroup(self)
+        for animation in (self.fade_in, self.hold, self.fade_out):
+            if animation is not self.hold:
+                animation.setDuration(self.FADE_DURATION)
+                animation.setEasingCurve(QEasingCurve.Type.OutQuad)
+            self.group.addAnimation(animation)
+        self.group.finished.connect(self.on_finished)
+
+    def is_active(self):
+        return self.group.state() != QAbstractAnimation.State.Stopped
+
+    @traced("notification", "animation")
+    def push(self, message):
+        if not self.is_active():
+            self.display(message)
+        elif message == self.current:
+            if self.group.currentAnimation() is not self.fade_in:
+                self.group.setCurrentTime(self.FADE_DURATION)
+        elif message not in self.pending:
+            self.pending.append(message)
+
+    def replace(self, message):
+        if self.is_active():
+            self.current = message
+            self.label.setText(message)
+
+    def display(self, message):
+        self.current = message
+        self.label.setText(message)
+        self.label.raise_()
+        self.label.show()
+        self.group.start()
+
+    def on_finished(self):
+        if self.pending:
+            self.display(self.pending.popleft())
+        else:
+            self.current = None
+            self.label.hide()
+
+    def settle(self):
+        self.pending.clear()
+        if self.is_active():
+            self.group.setCurrentTime(self.group.totalDuration())
@@ -0,0 +1,92 @@
+import array
+import datetime
+import hashlib
+import mmap
+import os
+import struct
+
+from .academic_calendar import DEFAULT_CALENDAR
+from .core import atomic_write
+
+SERIES_MAGIC = b"GTPS"
+SERIES_VERSION = 1
+HEADER = struct.Struct("<4sHxxiI16s")
+
+
+def series_key(start_year, num_courses, calendar_definition=None):
+    import json
+
+    payload = json.dumps([SERIES_VERSION, start_year, num_courses, calendar_definition], sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).digest()[:16]
+
+
+def series_path(settings_path, profile_id):
+    return os.path.join(os.path.dirname(settings_path), f"progress_{profile_id}.bin")
+
+
+def build_series(start_year, num_courses, calendar=None):
+    calendar = calendar or DEFAULT_CALENDAR
+    first, last = calendar.program_bounds(start_year, num_courses)
+    total = array.array("f")
+    semester = array.array("f")
+    for ordinal in range(first, last + 1):
+        total_progress, semester_progress = calendar.progress(start_year, num_courses,
+                                                              datetime.date.fromordinal(ordinal))
+        total.append(total_progress)
+        semester.append(semester_progress)
+    return first, total, semester
+
+
+def write_series(path, key, first, total, semester):
+    with atomic_write(path) as file:
+        file.write(HEADER.pack(SERIES_MAGIC, SERIES_VERSION, first, len(total), key))
+        total.tofile(file)
+        semester.tofile(file)
+
+
+class ProgressSeries:
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.first_ordinal, self.days, self.key = HEADER.unpack_from(self.mapping)
+            if (magic != SERIES_MAGIC or version != SERIES_VERSION
+                    or len(self.mapping) != HEADER.size + 2 * 4 * self.days):
+                raise ValueError(f"{path}: неподходящий формат ряда прогресса")
+        except (ValueError, struct.error):
+            self.mapping.close()
+            raise
+        self.values = memoryview(self.mapping)[HEADER.size:].cast("f")
+
+    def lookup(self, day):
+        index = day.toordinal() - self.first_ordinal
+        if 0 <= index < self.days:
+            return self.values[index], self.values[self.days + index]
+        return None
+
+    def elapsed_fraction(self, day):
+        return min(max((day.toordinal() - self.first_ordinal) / max(self.days - 1, 1), 0.0), 1.0)
+
+    def sample(self, points):
+        if points < 2 or self.days == 0:
+            return []
+        return [self.values[index * (self.days - 1) // (points - 1)] for index in range(points)]
+
+    def close(self):
+        self.values.release()
+        self.mapping.close()
+
+
+def load_series(path, start_year, num_courses, calendar_definition=None, calendar=None):
+    key = series_key(start_year, num_courses, calendar_definition)
+    try:
+        series = ProgressSeries(path)
+    except (OSError, ValueError):
+        series = None
+    if series is not None:
+        if series.key == key:
+            return series
+        series.close()
+
+    write_series(path, key, *build_series(start_year, num_courses, calendar))
+    return ProgressSeries(path)
@@ -0,0 +1,56 @@
+import os
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+
+class SettingsWatcher(QObject):
+    """Следит за settings.json и папкой изображений.
+
+    Пачка событий файловой системы превращается в один сигнал после паузы DEBOUNCE_MS. Атомарная замена
+    файла снимает его с наблюдения, поэтому наблюдается и папка настроек, а файл добавляется заново.
+    """
+
+    DEBOUNCE_MS = 250
+
+    settings_changed = pyqtSignal()
+    images_changed = pyqtSignal()
+
+    def __init__(self, settings_path, images_dir, parent=None):
+        super().__init__(parent)
+        self.settings_path = os.path.abspath(settings_path)
+        self.settings_dir = os.path.dirname(self.settings_path)
+        self.images_dir = os.path.abspath(images_dir)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_file_changed)
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+        self.settings_timer = self.debounce_timer(self.on_settings_settled)
+        self.images_timer = self.debounce_timer(self.images_changed.emit)
+        self.watch()
+
+    def debounce_timer(self, slot):
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.DEBOUNCE_MS)
+        timer.timeout.connect(slot)
+        return timer
+
+    def watch(self):
+        watched = set(self.watcher.files()) | set(self.watcher.directories())
+        paths = [path for path in (self.settings_path, self.settings_dir, self.images_dir)
+                 if path not in watched and os.path.exists(path)]
+        if paths:
+            self.watcher.addPaths(paths)
+
+    def on_file_changed(self, path):
+        self.settings_timer.start()
+
+    def on_directory_changed(self, path):
+        if path == self.images_dir:
+            self.images_timer.start()
+        else:
+            self.settings_timer.start()
+
+    def on_settings_settled(self):
+        self.watch()
+        self.settings_changed.emit()
@@ -0,0 +1,77 @@
+import hashlib
+import os
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+
+from .core import get_settings_path
+
+COMMANDS = ("show", "reload", "settings")
+CONNECT_TIMEOUT_MS = 200
+
+
+def server_name():
+    settings_path = os.path.abspath(get_settings_path())
+    return "grassailytimer-" + hashlib.sha1(settings_path.encode("utf-8")).hexdigest()[:16]
+
+
+def split_commands(argv):
+    commands = []
+    rest = []
+    for argument in argv:
+        if argument.startswith("--") and argument[2:] in COMMANDS:
+            commands.append(argument[2:])
+        else:
+            rest.append(argument)
+    return commands or ["show"], rest
+
+
+def forward_to_running_instance(commands, name=None):
+    socket = QLocalSocket()
+    socket.connectToServer(name or server_name())
+    if not socket.waitForConnected(CONNECT_TIMEOUT_MS):
+        return False
+    socket.write("".join(f"{command}\n" for command in commands).encode("utf-8"))
+    socket.waitForBytesWritten(CONNECT_TIMEOUT_MS)
+    socket.disconnectFromServer()
+    return True
+
+
+class InstanceServer(QObject):
+    command_received = pyqtSignal(str)
+
+    def __init__(self, parent=None, name=None):
+        super().__init__(parent)
+        self.name = name or server_name()
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self.on_new_connection)
+
+    def listen(self):
+        if self.server.listen(self.name):
+            return True
+        if self.server.serverError() != QLocalSocket.LocalSocketError.AddressInUseError:
+            return False
+        probe = QLocalSocket()
+        probe.connectToServer(self.name)
+        if probe.waitForConnected(CONNECT_TIMEOUT_MS):
+            probe.disconnectFromServer()
+            return False
+        QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def close(self):
+        self.server.close()
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self.read_commands(socket))
+            socket.disconnected.connect(socket.deleteLater)
+            self.read_commands(socket)
+
+    def read_commands(self, socket):
+        while socket.canReadLine():
+            command = bytes(socket.readLine()).decode("utf-8", "replace").strip()
+            if command in COMMANDS:
+                self.command_received.emit(command)
@@ -0,0 +1,159 @@
+import csv
+import datetime
+import json
+import os
+import sys
+import tempfile
+
+from .core import DEFAULT_PROFILE_ID, DEFAULT_SETTINGS, read_settings_document, split_profiles
+
+worker = None
+
+
+class SnapshotWorker:
+    """Рисует снимки в одном скрытом виджете: для каждого задания меняются только настройки, дата и фон."""
+
+    def __init__(self):
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+        from PyQt6.QtWidgets import QApplication
+
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        self.directory = tempfile.TemporaryDirectory(prefix="grassailytimer-snapshot-")
+        self.settings_path = os.path.join(self.directory.name, "settings.json")
+        self.images_dir = os.path.join(self.directory.name, "images")
+        os.makedirs(self.images_dir)
+        self.store = None
+        self.widget = None
+
+    def prepare(self, job):
+        from PyQt6.QtCore import Qt
+        from .core import SettingsStore, find_background_image, save_settings
+        from .gui import TransparentWidget, file_signature
+
+        document = {"profiles": [dict(job["settings"], id="snapshot")]}
+        today = datetime.date.fromisoformat(job["as_of"])
+        if self.widget is None:
+            save_settings(self.settings_path, document)
+            self.store = SettingsStore(self.settings_path, debounce=3600)
+            self.widget = TransparentWidget("snapshot", self.store, today, self.images_dir)
+            self.widget.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen)
+            self.widget.show()
+        else:
+            self.store.reload(document)
+            self.widget.fixed_today = today
+            self.widget.reload_settings()
+
+        widget = self.widget
+        background = job.get("background") or find_background_image(self.images_dir, widget.background_name)
+        if background != widget.background_image or file_signature(background) != widget.background_signature:
+            widget.background_image = background
+            widget.load_background_image()
+        return widget
+
+    def render(self, job):
+        widget = self.prepare(job)
+        self.app.processEvents()
+        if not widget.grab().save(job["output"], "PNG"):
+            raise OSError(f"Не удалось сохранить {job['output']}")
+        return job["output"]
+
+    def close(self):
+        from PyQt6.QtCore import QEvent
+
+        if self.widget is not None:
+            self.widget.dispose()
+            self.store.close()
+            self.widget = self.store = None
+            self.app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        self.directory.cleanup()
+
+
+def init_worker():
+    global worker
+    worker = SnapshotWorker()
+
+
+def render_job(job):
+    return worker.render(job)
+
+
+def coerce(key, value):
+    if key == "calendar" and isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Некорректный JSON в поле calendar: {error}") from None
+    default = DEFAULT_SETTINGS.get(key)
+    if isinstance(value, str) and isinstance(default, bool):
+        return value.strip().lower() in ("1", "true", "yes")
+    if isinstance(value, str) and isinstance(default, int):
+        return int(value)
+    return value
+
+
+def read_rows(path, input_format):
+    source = sys.stdin if path == "-" else open(path, "r", encoding="utf-8", newline="")
+    try:
+        if input_format == "jsonl":
+            return [json.loads(line) for line in source if line.strip()]
+        return list(csv.DictReader(source))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def build_jobs(rows, output_dir, profiles, default_as_of, name_template):
+    jobs = []
+    for index, row in enumerate(rows):
+        profile_id = row.get("profile") or next(iter(profiles))
+        if profile_id not in profiles:
+            raise ValueError(f"Профиль {profile_id!r} не найден в настройках")
+        settings = dict(profiles[profile_id])
+        settings.pop("id", None)
+        for key, value in row.items():
+            if (key in DEFAULT_SETTINGS or key == "calendar") and value not in (None, ""):
+                settings[key] = coerce(key, value)
+
+        as_of = row.get("as_of") or default_as_of
+        name = row.get("output") or name_template.format(index=index, profile=profile_id, as_of=as_of,
+                                                         start_year=settings["start_year"],
+                                                         num_courses=settings["num_courses"])
+        jobs.append({
+            "settings": settings,
+            "as_of": as_of,
+            "background": row.get("background") or None,
+            "output": os.path.join(output_dir, name),
+        })
+    return jobs
+
+
+def run_snapshot(args):
+    from .batch import detect_format
+
+    profiles = {DEFAULT_PROFILE_ID: dict(DEFAULT_SETTINGS)}
+    if args.settings:
+        profiles = {profile["id"]: profile for profile in split_profiles(read_settings_document(args.settings))[0]}
+    default_as_of = (datetime.date.fromisoformat(args.as_of) if args.as_of else datetime.date.today()).isoformat()
+
+    rows = read_rows(args.input, detect_format(args.input, args.input_format))
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = build_jobs(rows, args.output_dir, profiles, default_as_of, args.name_template)
+
+    if args.workers <= 1:
+        init_worker()
+        try:
+            for job in jobs:
+                print(render_job(job))
+        finally:
+            worker.close()
+        return 0
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = max(1, min(64, len(jobs) // (args.workers * 4)))
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=init_worker) as executor:
+        for output in executor.map(render_job, jobs, chunksize=chunk_size):
+            print(output)
+    return 0
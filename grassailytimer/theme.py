@@ -0,0 +1,80 @@
+from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtWidgets import QApplication
+
+from .core import resource_path
+from .icon_pack import PACK_PATH, IconPack
+from .trace import traced
+
+APP_STYLESHEET = """
+    QPushButton[role="icon"] {
+        background: transparent;
+        border: none;
+    }
+    QPushButton[role="icon"]:hover {
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 12px;
+    }
+    QPushButton#aboutButton {
+        color: white;
+        font-weight: bold;
+    }
+    QPushButton[role="action"], QLineEdit {
+        border-radius: 10px;
+        padding: 5px;
+    }
+    QLabel[role="caption"] {
+        color: white;
+        border-radius: 10px;
+        padding: 5px;
+    }
+    StatusDisplay#statusLabel {
+        color: white;
+    }
+    QLabel#deadlineLabel {
+        color: rgba(255, 255, 255, 200);
+    }
+    QLabel#deadlineLabel[urgent="true"] {
+        color: #ffb703;
+    }
+    QLabel#notificationLabel {
+        background-color: rgba(0, 0, 0, 150);
+        color: white;
+        border-radius: 5px;
+        padding: 5px;
+    }
+"""
+
+_icons = {}
+_pack = None
+
+
+def load_icon(name):
+    global _pack
+    if _pack is None:
+        _pack = IconPack(resource_path(PACK_PATH))
+    variants = _pack.variants(name)
+    if not variants:
+        return QIcon(QPixmap(resource_path(f"assets/{name}")))
+    result = QIcon()
+    for _, scale, data in variants:
+        pixmap = QPixmap()
+        pixmap.loadFromData(data, "PNG")
+        pixmap.setDevicePixelRatio(scale)
+        result.addPixmap(pixmap)
+    return result
+
+
+def icon(name):
+    cached = _icons.get(name)
+    if cached is None:
+        cached = _icons[name] = load_icon(name)
+    return cached
+
+
+@traced("apply_theme", "style")
+def apply_theme(app=None):
+    app = app or QApplication.instance()
+    if app.property("grassailytimer_theme"):
+        return
+    app.setStyleSheet(app.styleSheet() + APP_STYLESHEET)
+    app.setProperty("grassailytimer_theme", True)
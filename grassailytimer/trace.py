@@ -0,0 +1,142 @@
+import atexit
+import functools
+import itertools
+import os
+import sys
+import threading
+import time
+
+ENV_VAR = "GRASSAILYTIMER_TRACE"
+METRICS_ENV_VAR = "GRASSAILYTIMER_METRICS"
+DEFAULT_TRACE_PATH = "grassailytimer-trace.json"
+BUFFER_SIZE = 16384
+CO_VARARGS = 0x04
+
+buffer = None
+output_path = None
+counters = None
+
+
+class TraceBuffer:
+    def __init__(self, size=BUFFER_SIZE):
+        self.size = size
+        self.events = [None] * size
+        self.sequence = itertools.count()
+        self.origin = time.perf_counter_ns()
+
+    def record(self, name, category, started, duration):
+        number = next(self.sequence)
+        self.events[number % self.size] = (number, name, category, started - self.origin, duration,
+                                           threading.get_ident())
+
+    def snapshot(self):
+        return sorted(event for event in list(self.events) if event is not None)
+
+
+def enable(path=None, size=BUFFER_SIZE):
+    global buffer, output_path
+    if buffer is None:
+        buffer = TraceBuffer(size)
+        atexit.register(dump)
+    output_path = path or output_path
+    return buffer
+
+
+def enabled():
+    return buffer is not None
+
+
+def enable_counters():
+    global counters
+    if counters is None:
+        counters = {}
+    return counters
+
+
+def count(name, duration):
+    entry = counters.get(name)
+    if entry is None:
+        entry = counters[name] = [0, 0, 0]
+    entry[0] += 1
+    entry[1] += duration
+    entry[2] = max(entry[2], duration)
+
+
+def traced(name, category="app"):
+    def decorate(function):
+        if buffer is None and counters is None:
+            return function
+        # Qt passes every signal argument to a plain callable, so drop the extras like it does for slots.
+        max_args = None if function.__code__.co_flags & CO_VARARGS else function.__code__.co_argcount
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter_ns()
+            try:
+                return function(*args[:max_args], **kwargs)
+            finally:
+                duration = time.perf_counter_ns() - started
+                if buffer is not None:
+                    buffer.record(name, category, started, duration)
+                if counters is not None:
+                    count(name, duration)
+        return wrapper
+    return decorate
+
+
+def mark(name, category="app"):
+    if buffer is not None:
+        buffer.record(name, category, time.perf_counter_ns(), 0)
+
+
+def summary(events):
+    totals = {}
+    for _, name, category, _, duration, _ in events:
+        entry = totals.setdefault(name, {"category": category, "count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        entry["count"] += 1
+        entry["total_ms"] += duration / 1e6
+        entry["max_ms"] = max(entry["max_ms"], duration / 1e6)
+    for entry in totals.values():
+        entry["mean_ms"] = entry["total_ms"] / entry["count"]
+    return totals
+
+
+def chrome_events(events):
+    pid = os.getpid()
+    trace_events = []
+    for _, name, category, started, duration, thread in events:
+        event = {"name": name, "cat": category, "ts": started / 1000, "pid": pid, "tid": thread}
+        if duration:
+            event.update(ph="X", dur=duration / 1000)
+        else:
+            event.update(ph="i", s="t")
+        trace_events.append(event)
+    return trace_events
+
+
+def dump(path=None):
+    import json
+
+    path = path or output_path
+    if buffer is None or not path:
+        return None
+    events = buffer.snapshot()
+    recorded = events[-1][0] + 1 if events else 0
+    report = {
+        "recorded": recorded,
+        "dropped": recorded - len(events),
+        "summary": summary(events),
+        "traceEvents": chrome_events(events),
+        "displayTimeUnit": "ms",
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file)
+    return path
+
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])
+elif "--trace" in sys.argv[1:]:
+    enable()
+if os.environ.get(METRICS_ENV_VAR) or "--metrics" in sys.argv[1:]:
+    enable_counters()
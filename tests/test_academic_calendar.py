@@ -0,0 +1,49 @@
+import datetime
+import unittest
+
+from grassailytimer.academic_calendar import (DEFAULT_CALENDAR, DEFAULT_CALENDAR_SETTINGS, AcademicCalendar,
+                                              batch_progress)
+
+
+class OverlappingTermsTest(unittest.TestCase):
+    def test_overlapping_terms_are_rejected(self):
+        terms = [{"name": "Осень", "start": "09-01", "end": "01-31"},
+                 {"name": "Весна", "start": "01-15", "end": "06-30"}]
+        with self.assertRaises(ValueError):
+            AcademicCalendar(terms)
+
+    def test_adjacent_terms_are_accepted(self):
+        terms = [{"name": "Осень", "start": "09-01", "end": "01-14"},
+                 {"name": "Весна", "start": "01-15", "end": "06-30"}]
+        calendar = AcademicCalendar(terms)
+        self.assertEqual(calendar.academic_days(2024, 1), 303)
+
+
+class DefaultCalendarTest(unittest.TestCase):
+    def test_closed_form_matches_index(self):
+        indexed = AcademicCalendar(DEFAULT_CALENDAR_SETTINGS["terms"])
+        for start_year in (1999, 2000, 2023, 2099, 2100):
+            for num_courses in (1, 4, 6):
+                self.assertEqual(DEFAULT_CALENDAR.academic_days(start_year, num_courses),
+                                 indexed.academic_days(start_year, num_courses))
+                today = datetime.date(start_year - 1, 6, 1)
+                while today.year <= start_year + num_courses + 1:
+                    self.assertEqual(
+                        (DEFAULT_CALENDAR.days_until_graduation(start_year, num_courses, today),)
+                        + DEFAULT_CALENDAR.progress(start_year, num_courses, today),
+                        (indexed.days_until_graduation(start_year, num_courses, today),)
+                        + indexed.progress(start_year, num_courses, today),
+                        (start_year, num_courses, today))
+                    today += datetime.timedelta(days=3)
+
+    def test_batch_matches_scalar(self):
+        dates = [datetime.date(2024, 2, 29), datetime.date(2024, 8, 15), datetime.date(2025, 9, 1)]
+        days_left, total, semester = batch_progress([2023] * 3, [4] * 3, dates)
+        for index, today in enumerate(dates):
+            self.assertEqual(days_left[index], DEFAULT_CALENDAR.days_until_graduation(2023, 4, today))
+            self.assertAlmostEqual(total[index], DEFAULT_CALENDAR.progress(2023, 4, today)[0])
+            self.assertAlmostEqual(semester[index], DEFAULT_CALENDAR.progress(2023, 4, today)[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
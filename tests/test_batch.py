@@ -0,0 +1,70 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from grassailytimer.batch import main
+
+INPUT = (
+    'student,start_year,num_courses,as_of\n'
+    '"Иванов\nИван",2023,4,2025-03-01\n'
+    'Петров,2022,4,2025-03-01\n'
+    '"Сидоров,\n""старший""",2021,6,2025-03-01\n'
+)
+
+
+class ProgressCsvTest(unittest.TestCase):
+    def run_progress(self, *options):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "input.csv")
+            target = os.path.join(directory, "output.csv")
+            with open(source, "w", encoding="utf-8", newline="") as file:
+                file.write(INPUT)
+            self.assertEqual(main(["progress", source, "-o", target, *options]), 0)
+            with open(target, "r", encoding="utf-8", newline="") as file:
+                return list(csv.reader(file))
+
+    def test_quoted_newline_survives_chunking(self):
+        expected = self.run_progress()
+        self.assertEqual([row[0] for row in expected[1:]], ["Иванов\nИван", "Петров", 'Сидоров,\n"старший"'])
+        for options in (("--chunk-size", "1"), ("--chunk-size", "2"), ("--chunk-size", "1", "-j", "2")):
+            with self.subTest(options=options):
+                self.assertEqual(self.run_progress(*options), expected)
+
+    def test_results_match_per_row_computation(self):
+        rows = self.run_progress("--chunk-size", "1")
+        self.assertEqual(rows[0], ["student", "start_year", "num_courses", "as_of",
+                                   "days_until_graduation", "total_progress", "semester_progress"])
+        self.assertEqual(len(rows), 4)
+        for row in rows[1:]:
+            self.assertEqual(len(row), 7)
+
+
+
+class JsonlToCsvTest(unittest.TestCase):
+    def run_progress(self, lines):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "input.jsonl")
+            target = os.path.join(directory, "output.csv")
+            with open(source, "w", encoding="utf-8") as file:
+                file.write("".join(line + "\n" for line in lines))
+            self.assertEqual(main(["progress", source, "-o", target, "--as-of", "2025-03-01"]), 0)
+            with open(target, "r", encoding="utf-8", newline="") as file:
+                return list(csv.reader(file))
+
+    def test_as_of_in_later_record_gets_a_column(self):
+        rows = self.run_progress(['{"id": 1, "start_year": 2020, "num_courses": 4}',
+                                  '{"id": 2, "start_year": 2020, "num_courses": 4, "as_of": "2022-02-02"}'])
+        self.assertEqual(rows[0][:4], ["id", "start_year", "num_courses", "as_of"])
+        self.assertEqual(rows[1][:4], ["1", "2020", "4", ""])
+        self.assertEqual(rows[2][:4], ["2", "2020", "4", "2022-02-02"])
+        self.assertNotEqual(rows[1][4], rows[2][4])
+
+    def test_unknown_key_in_later_record_is_an_error(self):
+        with self.assertRaisesRegex(ValueError, "group"):
+            self.run_progress(['{"id": 1, "start_year": 2020, "num_courses": 4}',
+                               '{"id": 2, "start_year": 2020, "num_courses": 4, "group": "A"}'])
+
+
+if __name__ == "__main__":
+    unittest.main()
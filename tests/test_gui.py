@@ -0,0 +1,98 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, Qt, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from grassailytimer.core import SettingsStore, save_settings
+from grassailytimer.gui import RefreshScheduler, TransparentWidget
+
+app = QApplication.instance() or QApplication([])
+
+
+class SuspendTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "settings.json")
+        save_settings(path, {"profiles": [{"id": "default", "start_year": 2023, "num_courses": 4}]})
+        store = SettingsStore(path, debounce=3600)
+        self.addCleanup(store.close)
+        self.widget = TransparentWidget("default", store, images_dir=directory.name)
+        self.widget.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen)
+        self.widget.show()
+        self.addCleanup(self.widget.dispose)
+        self.updates = 0
+        update_info = self.widget.update_info
+
+        def counted():
+            self.updates += 1
+            update_info()
+
+        self.widget.update_info = counted
+
+    def test_resume_refreshes_only_after_skipped_tick(self):
+        self.widget.set_visibility_blocker("hidden", True)
+        self.widget.set_visibility_blocker("hidden", False)
+        self.assertEqual(self.updates, 0)
+
+        self.widget.set_visibility_blocker("hidden", True)
+        self.widget.on_refresh_due()
+        self.widget.on_refresh_due()
+        self.assertEqual(self.updates, 0)
+        self.widget.set_visibility_blocker("hidden", False)
+        self.assertEqual(self.updates, 1)
+        self.assertFalse(self.widget.refresh_pending)
+
+
+
+class SettingsPanelTest(unittest.TestCase):
+    def test_settings_panel_does_not_change_saved_width(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "settings.json")
+        save_settings(path, {"profiles": [{"id": "default", "start_year": 2023, "num_courses": 4,
+                                           "window_width": 300}]})
+        store = SettingsStore(path, debounce=3600)
+        self.addCleanup(store.close)
+        widget = TransparentWidget("default", store, images_dir=directory.name)
+        widget.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen)
+        widget.show()
+        self.addCleanup(widget.dispose)
+
+        for _ in range(2):
+            widget.toggle_settings()
+            widget.animation.setCurrentTime(widget.animation.totalDuration())
+            app.processEvents()
+        self.assertEqual(store.profiles["default"]["window_width"], 300)
+        self.assertEqual(widget.width(), 300)
+
+
+class RefreshSchedulerTest(unittest.TestCase):
+    def test_short_wait_does_not_spin(self):
+        scheduler = RefreshScheduler()
+        self.addCleanup(scheduler.deleteLater)
+        timeouts = []
+        scheduler.timer.timeout.connect(lambda: timeouts.append(datetime.datetime.now()))
+        loop = QEventLoop()
+        fired = []
+
+        def due():
+            fired.append(datetime.datetime.now())
+            loop.quit()
+
+        target = datetime.datetime.now() + datetime.timedelta(seconds=0.3)
+        scheduler.schedule_at(due, target)
+        QTimer.singleShot(5000, loop.quit)
+        loop.exec()
+        self.assertEqual(len(fired), 1)
+        self.assertGreaterEqual(fired[0], target)
+        self.assertLessEqual(len(timeouts), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from grassailytimer.core import SettingsStore, atomic_write, save_settings
+
+
+class SettingsStoreTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = os.path.join(directory.name, "config")
+        os.makedirs(self.directory)
+        self.path = os.path.join(self.directory, "settings.json")
+        save_settings(self.path, {"profiles": [{"id": "default", "start_year": 2023, "num_courses": 4}]})
+
+    def read(self):
+        with open(self.path, "r", encoding="utf-8") as file:
+            return json.load(file)["profiles"][0]
+
+    def wait_for(self, key, value):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                if self.read().get(key) == value:
+                    return
+            except OSError:
+                pass
+            time.sleep(0.01)
+
+    def test_failed_write_is_retried(self):
+        store = SettingsStore(self.path, debounce=0.01)
+        shutil.rmtree(self.directory)
+        store.update("default", opacity=10)
+        deadline = time.monotonic() + 5
+        while store.deadline is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        self.assertTrue(store.writer.is_alive())
+        self.assertTrue(store.is_dirty())
+        with self.assertRaises(OSError):
+            store.close()
+
+        os.makedirs(self.directory)
+        store.update("default", num_courses=5)
+        self.wait_for("num_courses", 5)
+        self.assertEqual(self.read()["opacity"], 10)
+        self.assertTrue(store.writer.is_alive())
+        store.close()
+
+    def test_updates_are_written_by_one_thread(self):
+        store = SettingsStore(self.path, debounce=0.05)
+        threads = threading.active_count()
+        for opacity in range(1, 101):
+            store.update("default", opacity=opacity)
+        self.assertEqual(threading.active_count(), threads + 1)
+        self.wait_for("opacity", 100)
+        self.assertEqual(self.read()["opacity"], 100)
+
+        store.update("default", opacity=7)
+        self.assertEqual(threading.active_count(), threads + 1)
+        writer = store.writer
+        self.assertTrue(store.close())
+        writer.join(1)
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(self.read()["opacity"], 7)
+
+
+
+class AtomicWriteTest(unittest.TestCase):
+    def test_failed_write_keeps_old_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.bin")
+            with atomic_write(path) as file:
+                file.write(b"old")
+            with self.assertRaises(RuntimeError):
+                with atomic_write(path) as file:
+                    file.write(b"new")
+                    raise RuntimeError
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), b"old")
+            self.assertEqual(os.listdir(directory), ["data.bin"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from grassailytimer.snapshot import SnapshotWorker, coerce
+
+
+class CoerceTest(unittest.TestCase):
+    def test_calendar_from_csv_is_parsed(self):
+        calendar = coerce("calendar", '{"terms": [{"start": "09-01", "end": "06-30"}]}')
+        self.assertEqual(calendar, {"terms": [{"start": "09-01", "end": "06-30"}]})
+
+    def test_malformed_calendar_is_reported(self):
+        with self.assertRaisesRegex(ValueError, "calendar"):
+            coerce("calendar", "{terms")
+
+
+class SnapshotWorkerTest(unittest.TestCase):
+    def setUp(self):
+        self.worker = SnapshotWorker()
+        self.addCleanup(self.worker.close)
+        self.output = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output.cleanup)
+
+    def job(self, name, **settings):
+        return {
+            "settings": dict({"start_year": 2023, "num_courses": 4}, **settings),
+            "as_of": "2025-03-01",
+            "background": None,
+            "output": os.path.join(self.output.name, name),
+        }
+
+    def read(self, name):
+        with open(os.path.join(self.output.name, name), "rb") as file:
+            return file.read()
+
+    def test_widget_is_reused_between_jobs(self):
+        from PyQt6.QtWidgets import QApplication
+
+        self.worker.render(self.job("first.png"))
+        widgets = len(QApplication.topLevelWidgets())
+        self.worker.render(self.job("other.png", start_year=2021, num_courses=6, window_width=300))
+        self.worker.render(self.job("again.png"))
+        self.assertEqual(len(QApplication.topLevelWidgets()), widgets)
+        self.assertEqual(self.read("first.png"), self.read("again.png"))
+        self.assertNotEqual(self.read("first.png"), self.read("other.png"))
+
+
+if __name__ == "__main__":
+    unittest.main()